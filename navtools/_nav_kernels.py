@@ -0,0 +1,276 @@
+"""
+The compiled numerical kernels for :py:mod:`navtools.navigation`
+and :py:mod:`navtools.igrf`.
+
+These are small functions of float values (or 1-D float arrays) in radians,
+with no :py:class:`navigation.Angle` or :py:class:`navigation.LatLon` objects.
+If Numba (https://numba.pydata.org) is installed, they're compiled;
+otherwise, they're ordinary Python functions and ``HAVE_NUMBA`` is ``False``.
+
+>>> d, tc = rb_kernel(0.655, -1.332, 0.650, -1.327, 3440.069)
+>>> round(d, 2), round(tc, 4)
+(21.97, 2.4702)
+"""
+
+import math
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _njit_fallback(*args: Any, **kwargs: Any) -> Callable[[F], F]:
+    """Without Numba, the kernels are ordinary Python functions."""
+
+    def decorator(function: F) -> F:
+        return function
+
+    return decorator
+
+
+if TYPE_CHECKING:
+    # Type checking sees the kernels with their own Python signatures.
+    HAVE_NUMBA: bool
+    njit = _njit_fallback
+else:
+    try:
+        from numba import njit
+
+        HAVE_NUMBA = True
+    except ImportError:  # pragma: no cover
+        HAVE_NUMBA = False
+        njit = _njit_fallback
+
+
+PI = math.pi
+TWO_PI = math.tau
+INV_TWO_PI = 1 / math.tau
+HALF_PI = math.pi / 2
+QUARTER_PI = math.pi / 4
+
+
+@njit(cache=True, fastmath=True, error_model="numpy", nogil=True)
+def rb_kernel(
+    lat1: float, lon1: float, lat2: float, lon2: float, R: float
+) -> tuple[float, float]:
+    """
+    The range and bearing calculation on plain float radians.
+    When Numba is installed, this is compiled.
+    """
+    # Take the short way around when the leg crosses the antimeridian.
+    # The same floor-based reduction into [-pi, pi) as destination_kernel:
+    # no branch when compiled, and a leg within +/-pi is left as it is.
+    dlon = lon2 - lon1
+    dlon -= TWO_PI * math.floor((dlon + PI) * INV_TWO_PI)
+    d_NS = R * (lat2 - lat1)
+    d_EW = R * math.cos((lat2 + lat1) / 2) * dlon
+    d = math.hypot(d_NS, d_EW)
+    tc = math.atan2(d_EW, d_NS)
+    # atan2() is in [-pi, pi]. Compiled, this compare and add is a select,
+    # not a branch, and it's cheaper than the fmod behind ``%``.
+    if tc < 0.0:
+        tc += TWO_PI
+    return d, tc
+
+
+@njit(cache=True, fastmath=True, error_model="numpy", nogil=True)
+def rb_kernel_array(
+    lat1: NDArray[np.float64],
+    lon1: NDArray[np.float64],
+    lat2: NDArray[np.float64],
+    lon2: NDArray[np.float64],
+    R: float,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    The range and bearing calculation over 1-D arrays of the same size.
+    When Numba is installed, this is compiled.
+    """
+    n = lat1.shape[0]
+    d = np.empty(n)
+    tc = np.empty(n)
+    for i in range(n):
+        d[i], tc[i] = rb_kernel(lat1[i], lon1[i], lat2[i], lon2[i], R)
+    return d, tc
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def sincos(x: float) -> tuple[float, float]:
+    """
+    The sine and cosine of one angle.
+    When compiled, the two share the argument reduction.
+    """
+    return math.sin(x), math.cos(x)
+
+
+@njit(cache=True, fastmath=True, error_model="numpy", nogil=True)
+def destination_kernel(
+    lat1: float, lon1: float, d: float, theta: float
+) -> tuple[float, float]:
+    """
+    The destination calculation on plain float radians.
+    The distance, ``d``, is also in radians.
+    When Numba is installed, this is compiled.
+    """
+    sin_theta, cos_theta = sincos(theta)
+    lat2 = lat1 + d * cos_theta
+    # check for some daft bugger going past the pole, normalize latitude if so
+    if abs(lat2) > HALF_PI:
+        lat2 = PI - lat2 if lat2 > 0 else -(PI - lat2)
+    dLat = lat2 - lat1
+    if abs(dLat) < 1.0e-6:
+        q = math.cos(lat1)
+    else:
+        dPhi = math.log(
+            math.tan(lat2 / 2 + QUARTER_PI) / math.tan(lat1 / 2 + QUARTER_PI)
+        )
+        q = dLat / dPhi
+
+    dLon = d * sin_theta / q
+    # floor-based reduction into [-pi, pi); cheaper than the fmod behind ``%``
+    t = lon1 + dLon
+    lon2 = t - TWO_PI * math.floor((t + PI) * INV_TWO_PI)
+    return lat2, lon2
+
+
+@njit(cache=True, fastmath=True, error_model="numpy", nogil=True)
+def destination_kernel_array(
+    lat1: NDArray[np.float64],
+    lon1: NDArray[np.float64],
+    d: NDArray[np.float64],
+    theta: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    The destination calculation over 1-D arrays of the same size.
+    When Numba is installed, this is compiled.
+    """
+    n = lat1.shape[0]
+    lat2 = np.empty(n)
+    lon2 = np.empty(n)
+    for i in range(n):
+        lat2[i], lon2[i] = destination_kernel(lat1[i], lon1[i], d[i], theta[i])
+    return lat2, lon2
+
+
+@njit(cache=True, error_model="numpy", nogil=True)
+def igrf_kernel(
+    g_year: Any,
+    g_next: Any,
+    h_year: Any,
+    h_next: Any,
+    tc: float,
+    t: float,
+    nmx: int,
+    nlat: float,
+    elong: float,
+    alt: float,
+    geodetic: bool,
+) -> tuple[float, float, float, float]:
+    """
+    The spherical harmonic synthesis for :py:class:`navtools.igrf.IGRF`.
+
+    The ``g`` and ``h`` coefficients are indexed ``[n][m]``, for the model year
+    and the following five-year model. They're weighted by ``tc`` and ``t``.
+    When Numba is installed, this is compiled and the coefficients are 2-D arrays;
+    otherwise, nested lists are faster.
+    This isn't ``fastmath``, so both forms give the same results.
+    """
+    kmx = (nmx + 1) * (nmx + 2) // 2  # total number of coefficients
+
+    # Note: these arrays use Fortran-style one-based indexing.
+    p = [0.0] * (kmx + 1)
+    q = [0.0] * (kmx + 1)
+    cl = [0.0] * (nmx + 1)
+    sl = [0.0] * (nmx + 1)
+
+    colat = HALF_PI - nlat
+    x, y, z = 0.0, 0.0, 0.0
+
+    r = alt  # radius for Geocentric; will be fixed for geodetic
+    st, ct = sincos(colat)
+    sl[1], cl[1] = sincos(elong)
+    cd = 1.0
+    sd = 0.0
+
+    if geodetic:
+        # conversion from geodetic to geocentric coordinates
+        # (using the WGS84 spheroid)
+        a2 = 40680631.6
+        b2 = 40408296.0
+        one = a2 * st * st
+        two = b2 * ct * ct
+        three = one + two
+        rho = math.sqrt(three)
+        r = math.sqrt(alt * (alt + 2.0 * rho) + (a2 * one + b2 * two) / three)
+        cd = (alt + rho) / r
+        sd = (a2 - b2) / rho * ct * st / r
+        one = ct
+        ct = ct * cd - st * sd
+        st = st * cd + one * sd
+
+    ratio = 6371.2 / r  # Earth Mean Radius in km
+    rr = ratio * ratio
+
+    # computation of Schmidt quasi-normal coefficients p and x(=q)
+    p[1] = 1.0
+    p[3] = st
+    q[1] = 0.0
+    q[3] = ct
+
+    n = 0  # Outer loop (from 1 to nmx)
+    m = 1  # Inner loop (from 1 to n)
+    fn = 0.0
+    gn = 0.0
+    for k in range(2, kmx + 1):
+        if n < m:
+            m = 0
+            n = n + 1
+            rr = rr * ratio
+            fn = float(n)
+            gn = float(n - 1)
+        fm = float(m)
+        if m == n:
+            if k != 3:
+                one = math.sqrt(1.0 - 0.5 / fm)
+                j = k - n - 1
+                p[k] = one * st * p[j]
+                q[k] = one * (st * q[j] + ct * p[j])
+                cl[m] = cl[m - 1] * cl[1] - sl[m - 1] * sl[1]
+                sl[m] = sl[m - 1] * cl[1] + cl[m - 1] * sl[1]
+        else:  # m != n
+            gmm = m * m
+            one = math.sqrt(fn * fn - gmm)
+            two = math.sqrt(gn * gn - gmm) / one
+            three = (fn + gn) / one
+            i = k - n
+            j = i - n + 1
+            p[k] = three * ct * p[i] - two * p[j]
+            q[k] = three * (ct * q[i] - st * p[i]) - two * q[j]
+
+        # synthesis of x, y and z in geocentric coordinates
+        one = (tc * g_year[n][m] + t * g_next[n][m]) * rr
+        if m != 0:
+            # m non-zero case, use h.
+            two = (tc * h_year[n][m] + t * h_next[n][m]) * rr
+            three = one * cl[m] + two * sl[m]
+            x = x + three * q[k]
+            z = z - (fn + 1.0) * three * p[k]
+            # Exact equality check, may not be a good idea.
+            if st != 0:  # sine colat == 0  is equator?
+                y = y + (one * sl[m] - two * cl[m]) * fm * p[k] / st
+            else:
+                y = y + (one * sl[m] - two * cl[m]) * q[k] * ct
+        else:
+            # m=0 case, use g only.
+            x = x + one * q[k]
+            z = z - (fn + 1.0) * one * p[k]
+        m = m + 1
+
+    # conversion back to coordinate system specified by itype
+    one = x
+    x = x * cd + z * sd
+    z = z * cd - one * sd
+    f = math.sqrt(x * x + y * y + z * z)
+
+    return x, y, z, f
@@ -185,7 +185,7 @@ class LogEntry:
 
     def __post_init__(self) -> None:
         self.point = navigation.LatLon(self.lat, self.lon)
-        self.geocode = olc.OLC().encode(degrees(self.lat), degrees(self.lon))
+        self.geocode = olc.geocode(degrees(self.lat), degrees(self.lon))
 
 
 GPS_NAVX_HEADER = [
@@ -423,17 +423,27 @@ def gen_rhumb(log_entry_iter: Iterator[LogEntry]) -> Iterator[LogEntry_Rhumb]:
     Each point has range and bearing to the next point.
     The last point as no range and bearing.
 
+    The log is read into memory so the ranges and bearings of all of the legs
+    can be computed at once with :py:meth:`navigation.LatLonArray.range_bearing`.
+
     :param log_entry_iter: iterable sequence of :py:class:`LogEntry` instances.
         This can be produced by :py:func:`gpx_to_LogEntry` or :py:func:`csv_to_LogEntry`.
     :return: iterable sequence of  :py:class:`LogEntry_Rhumb` instances.
     """
-    p1 = next(log_entry_iter)
-    for p2 in log_entry_iter:
-        # print( repr(p1), repr(p2) )
-        r, theta = navigation.range_bearing(p1.point, p2.point)
-        yield LogEntry_Rhumb(p1, r, theta, p2.time - p1.time)
-        p1 = p2
-    yield LogEntry_Rhumb(p2, None, None, None)
+    log = list(log_entry_iter)
+    if not log:
+        return
+    distances, bearings = navigation.LatLonArray.from_latlons(
+        entry.point for entry in log
+    ).range_bearing()
+    for leg, (p1, p2) in enumerate(zip(log, log[1:])):
+        yield LogEntry_Rhumb(
+            p1,
+            float(distances[leg]),
+            navigation.Angle(bearings[leg]),
+            p2.time - p1.time,
+        )
+    yield LogEntry_Rhumb(log[-1], None, None, None)
 
 
 def nround(value: Optional[float], digits: Optional[Any]) -> Union[int, float, None]:
@@ -152,9 +152,13 @@ import math
 import pathlib
 import pprint
 import re
-from typing import Callable, Tuple, Optional
+from typing import Any, Callable, Tuple, Optional
 import warnings
 
+import numpy as np
+
+from navtools._nav_kernels import HAVE_NUMBA, igrf_kernel
+
 IGRF_Func = Callable[
     [float, float, float, float, str], Tuple[float, float, float, float]
 ]
@@ -184,6 +188,7 @@ class IGRF:
         self.g: dict[int, dict[tuple[int, int], float]] = {}
         self.h: dict[int, dict[tuple[int, int], float]] = {}
         self.extrapolate: int = 0
+        self.gh: dict[int, tuple[Any, Any]] = {}
 
     def prepare(self) -> None:
         """
@@ -213,6 +218,25 @@ class IGRF:
                 continue
         if not self.g or not self.h:
             raise RuntimeError(f"Model not found in {self.name}, {installed}, {parent}")
+        self.gh = {
+            year: (IGRF.dense(self.g[year]), IGRF.dense(self.h[year]))
+            for year in self.g
+        }
+
+    @staticmethod
+    def dense(coeffs: dict[tuple[int, int], float]) -> Any:
+        """
+        Lays out one year's sparse ``[n, m]`` coefficients for :py:func:`igrf_kernel`.
+        With Numba, this is a 2-D array; without it, nested lists are faster.
+
+        :param coeffs: the g or h coefficients for a year.
+        :returns: the coefficients, indexed ``[n][m]``, with zeros where there's no value.
+        """
+        size = max(n for n, m in coeffs) + 1
+        table = np.zeros((size, size))
+        for (n, m), coef in coeffs.items():
+            table[n, m] = coef
+        return table if HAVE_NUMBA else table.tolist()
 
     @staticmethod
     def load_coeffs(
@@ -335,29 +359,18 @@ class IGRF:
         """
         self.prepare()
 
-        # Note: these arrays will use Fortran-style one-based indexing.
-        p: dict[int, float] = {}
-        q: dict[int, float] = {}
-        cl: dict[int, float] = {}
-        sl: dict[int, float] = {}
-
-        colat = math.pi / 2 - nlat
-        x, y, z = 0.0, 0.0, 0.0
-
         ## Resolve Year and Interpolation/Extrapolation
         if date < self.extrapolate:
             ll = int(date - 1900) // 5  # year index
             t = (date - 1900) / 5 - ll  # weighting factor
             if date < 1995:
                 nmx = 10  # degrees
-                kmx = (nmx + 1) * (nmx + 2) // 2  # total number of coefficients
 
                 # unused Fortran indexing
                 # nc = nmx*(nmx+2) # size of gh array = 120
                 # ll = nc*ll # index of year index in original massive gh array
             else:
                 nmx = 13  # degrees
-                kmx = (nmx + 1) * (nmx + 2) // 2  # total number of coefficients
 
                 # unused Fortran indexing
                 # nc = nmx*(nmx+2) # size of gh array = 195
@@ -371,7 +384,6 @@ class IGRF:
             t = date - self.extrapolate
             tc = 1.0
             nmx = 13  # degrees
-            kmx = (nmx + 1) * (nmx + 2) // 2  # total number of coefficients
 
             # unused Fortran indexing
             # nc = nmx*(nmx+2) # size of gh array = 195 for last two years
@@ -379,119 +391,11 @@ class IGRF:
 
             year = self.extrapolate
 
-        ##print( "date {0}, year_key {1}, ll {2}, nc {3}".format(date, year_key, ll, nc) )
-
-        ## 2
-        r = alt  # radius for Geocentric; will be fixed for geodetic
-        ct = math.cos(colat)
-        st = math.sin(colat)
-        cl[1] = math.cos(elong)
-        sl[1] = math.sin(elong)
-        cd = 1.0
-        sd = 0.0
-
-        if coord == "D":
-            ##  conversion from geodetic to geocentric coordinates
-            ##  (using the WGS84 spheroid)
-            a2 = 40680631.6
-            b2 = 40408296.0
-            one = a2 * st * st
-            two = b2 * ct * ct
-            three = one + two
-            rho = math.sqrt(three)
-            r = math.sqrt(alt * (alt + 2.0 * rho) + (a2 * one + b2 * two) / three)
-            cd = (alt + rho) / r
-            sd = (a2 - b2) / rho * ct * st / r
-            one = ct
-            ct = ct * cd - st * sd
-            st = st * cd + one * sd
-
-        ## 3
-        ratio = 6371.2 / r  # Earth Mean Radius in km
-        rr = ratio * ratio
-
-        ## computation of Schmidt quasi-normal coefficients p and x(=q)
-
-        p[1] = 1.0
-        p[3] = st
-        q[1] = 0.0
-        q[3] = ct
-
-        # l     = 1
-        n = 0  # Outer loop (from 1 to nmx)
-        m = 1  # Inner loop (from 1 to n)
-        for k in range(2, kmx + 1):
-            if n < m:
-                m = 0
-                n = n + 1
-                rr = rr * ratio
-                fn = n
-                gn = n - 1
-            ## 4
-            fm = m
-            if m == n:
-                if k != 3:
-                    one = math.sqrt(1.0 - 0.5 / fm)
-                    j = k - n - 1
-                    p[k] = one * st * p[j]
-                    q[k] = one * (st * q[j] + ct * p[j])
-                    cl[m] = cl[m - 1] * cl[1] - sl[m - 1] * sl[1]
-                    sl[m] = sl[m - 1] * cl[1] + cl[m - 1] * sl[1]
-            else:  # m != n
-                ## 5
-                gmm = m * m
-                one = math.sqrt(fn * fn - gmm)
-                two = math.sqrt(gn * gn - gmm) / one
-                three = (fn + gn) / one
-                i = k - n
-                j = i - n + 1
-                p[k] = three * ct * p[i] - two * p[j]
-                q[k] = three * (ct * q[i] - st * p[i]) - two * q[j]
-
-            ## 6
-            ## synthesis of x, y and z in geocentric coordinates
-            # unused Fortran indexing
-            # lm = ll + l # Index into gh based on ll (year) + l (iteration)
-            # print( "n {0}, m {1}, gh[year][n,m] {2}".format(n,m,l) )
-
-            g_year = self.g[year][n, m]
-            g_next = self.g[year + 5][n, m]
-            one = (tc * g_year + t * g_next) * rr
-            if m != 0:
-                # m non-zero case, use h.
-                h_year = self.h[year][n, m]
-                h_next = self.h[year + 5][n, m]
-
-                two = (tc * h_year + t * h_next) * rr
-                three = one * cl[m] + two * sl[m]
-                x = x + three * q[k]
-                z = z - (fn + 1.0) * three * p[k]
-                # Exact equality check, may not be a good idea.
-                if st != 0:  # sine colat == 0  is equator?
-                    y = y + (one * sl[m] - two * cl[m]) * fm * p[k] / st
-                else:
-                    ## 7
-                    y = y + (one * sl[m] - two * cl[m]) * q[k] * ct
-                ## 8
-                # l     = l + 2
-            else:
-                # m=0 case, use g only.
-                ## 9
-                x = x + one * q[k]
-                z = z - (fn + 1.0) * one * p[k]
-                # l     = l + 1
-            ## 10
-            m = m + 1
-
-        # End of the coefficient loop on k
-
-        ## conversion back to coordinate system specified by itype
-        one = x
-        x = x * cd + z * sd
-        z = z * cd - one * sd
-        f = math.sqrt(x * x + y * y + z * z)
-
-        return x, y, z, f
+        g_year, h_year = self.gh[year]
+        g_next, h_next = self.gh[year + 5]
+        return igrf_kernel(
+            g_year, g_next, h_year, h_next, tc, t, nmx, nlat, elong, alt, coord == "D"
+        )
 
 
 igrfsyn = IGRF("igrf13coeffs.txt")
@@ -75,6 +75,7 @@ The Format 6 file layout can be described as follows:
 
 """
 import abc
+import concurrent.futures
 import csv
 from dataclasses import dataclass
 import datetime
@@ -202,6 +203,20 @@ class Field(abc.ABC):  # pragma: no cover
         yield {"name": f"{prefix}{self.name}"}
 
 
+class _NonNegDict(Dict[str, Any]):
+    """
+    Field values used to fill in ``{name}`` placeholders in an encoding.
+    A negative length (e.g., -1 for an absent string) is treated as zero.
+    """
+
+    def __missing__(self, key: str) -> Any:
+        raise KeyError(key)
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        return value if value >= 0 else 0
+
+
 class AtomicField(Field):
     """
     An isolated, atomic field or sequence of fields that we are not examining more deeply.
@@ -232,20 +247,21 @@ class AtomicField(Field):
         self.name = name
         self.encoding = encoding
         self.conversion = conversion or (lambda x: x[0])
+        try:
+            self._report_size = f"{struct.calcsize(encoding)}"
+            self._report_format = encoding
+        except struct.error:
+            self._report_size = "varies"
+            self._report_format = ""
 
     def extract(self, context: "UnpackContext") -> Any:
         conversion = self.conversion
         format = self.encoding
-        replacements = re.finditer(r"\{(\w+)\}", format)
-        for repl in replacements:
-            name = repl.group(1)
-            value = context.fields[name]
-            format = re.sub(
-                f"\\{{{name}\\}}", str(value if value >= 0 else 0), format, count=1
-            )
+        if "{" in format:
+            format = format.format_map(_NonNegDict(context.fields))
         try:
             size = struct.calcsize(format)
-            source_bytes = context.source.read(size)
+            source_bytes = context.read(size)
         except Exception as ex:
             print(ex)
             print(self)
@@ -257,7 +273,7 @@ class AtomicField(Field):
         except Exception as ex:
             print(ex)
             print(self)
-            print(f"{source_bytes!r}")
+            print(f"{bytes(source_bytes)!r}")
             print(context.fields)
             raise
         context.fields[self.name] = results
@@ -265,13 +281,11 @@ class AtomicField(Field):
 
     def report(self, context: str = "") -> Iterable[dict[str, str]]:
         prefix = f"{context} - " if context else ""
-        try:
-            format = self.encoding
-            size = f"{struct.calcsize(self.encoding)}"
-        except struct.error:
-            format = ""
-            size = "varies"
-        yield {"name": f"{prefix}{self.name}", "format": format, "size": size}
+        yield {
+            "name": f"{prefix}{self.name}",
+            "format": self._report_format,
+            "size": self._report_size,
+        }
 
 
 class FieldList(Field):
@@ -283,7 +297,6 @@ class FieldList(Field):
 
     def extract(self, context: "UnpackContext") -> dict[str, Any]:
         # print(self.name)
-        # dump_next(context.source, 160)
         results = {field.name: field.extract(context) for field in self.field_list}
         context.fields[self.name] = results
         return results
@@ -306,7 +319,10 @@ class FieldRepeat(Field):
 
     def extract(self, context: "UnpackContext") -> list[Any]:
         repeat_value = context.fields[self.count]
-        results = [self.field_list.extract(context) for repeat in range(repeat_value)]
+        results: list[Any] = [None] * max(repeat_value, 0)
+        extract = self.field_list.extract
+        for i in range(repeat_value):
+            results[i] = extract(context)
         context.fields[self.name] = results
         return results
 
@@ -317,6 +333,70 @@ class FieldRepeat(Field):
         yield from self.field_list.report(subcontext)
 
 
+Extractor = Callable[["UnpackContext"], Any]
+
+
+class Parser:
+    """
+    A parser built from a :py:class:`Field` schema.
+
+    The schema is walked once, when the parser is built, to create nested extraction functions.
+    Fixed-size fields are bound to a precompiled :py:class:`struct.Struct`.
+    Fields with an encoding that depends on other fields use :py:meth:`AtomicField.extract`.
+
+    The schema is retained; it's used by :py:func:`layout` to report the file structure.
+    """
+
+    def __init__(self, schema: Field) -> None:
+        self.schema = schema
+        self.extractor = self.compile(schema)
+
+    def compile(self, field: Field) -> Extractor:
+        """Creates an extraction function for a field."""
+        name = field.name
+        if isinstance(field, FieldList):
+            extractors = [(f.name, self.compile(f)) for f in field.field_list]
+
+            def extract_list(context: UnpackContext) -> dict[str, Any]:
+                results = {f_name: extract(context) for f_name, extract in extractors}
+                context.fields[name] = results
+                return results
+
+            return extract_list
+
+        elif isinstance(field, FieldRepeat):
+            count = field.count
+            extract = self.compile(field.field_list)
+
+            def extract_repeat(context: UnpackContext) -> list[Any]:
+                repeat_value = context.fields[count]
+                results: list[Any] = [None] * max(repeat_value, 0)
+                for i in range(repeat_value):
+                    results[i] = extract(context)
+                context.fields[name] = results
+                return results
+
+            return extract_repeat
+
+        elif isinstance(field, AtomicField) and "{" not in field.encoding:
+            unpack = struct.Struct(field.encoding).unpack
+            size = struct.calcsize(field.encoding)
+            conversion = field.conversion
+
+            def extract_atomic(context: UnpackContext) -> Any:
+                results = conversion(unpack(context.read(size)))
+                context.fields[name] = results
+                return results
+
+            return extract_atomic
+
+        return field.extract
+
+    def parse(self, context: "UnpackContext") -> Any:
+        """Extracts the fields defined by the schema."""
+        return self.extractor(context)
+
+
 class UnpackContext:
     """
     Used to unpack a binary file. This is used to manage the input
@@ -326,35 +406,37 @@ class UnpackContext:
     THe fields includes the currently named fields being processed.
     This makes them visible for resolving dependencies in repeating fields and formats
     that depend on the values of other fields.
+
+    The entire file is read into a buffer.
+    USR files are small, and this avoids an I/O request for each field.
     """
 
-    def __init__(self, source: BinaryIO) -> None:
-        self.source = source
+    def __init__(self, source: Union[BinaryIO, bytes]) -> None:
+        data = source if isinstance(source, bytes) else source.read()
+        self.buffer = memoryview(data)
+        self.pos = 0
         self.fields: dict[str, Any] = {}
 
+    def read(self, size: int) -> memoryview:
+        """Returns the next ``size`` bytes of the buffer."""
+        start = self.pos
+        self.pos = start + size
+        return self.buffer[start : self.pos]
+
     def extract(self, field_list: Field) -> Union[Any, dict[str, Any], list[Any]]:
         """Extracts the next fields present in the file of bytes."""
         return field_list.extract(self)
 
     def peek(self, field: AtomicField) -> Any:
         """Peeks ahead in the file of bytes to see what follows."""
-        here = self.source.tell()
+        here = self.pos
         result = field.extract(self)
-        self.source.seek(here)
+        self.pos = here
         return result
 
     def eof(self) -> bool:
-        """
-        At EOF? Try to read another byte.
-        Might be better to get the file size and compare the tell location.
-        """
-        here = self.source.tell()
-        if len(next8 := self.source.read(8)) == 0:
-            return True
-        else:
-            # DEBUG: print(f"{next8!r}")
-            self.source.seek(here)
-            return False
+        """At EOF? Compare the position with the size of the buffer."""
+        return self.pos >= len(self.buffer)
 
 
 JD_TO_ORDINAL = 1721425
@@ -385,8 +467,30 @@ class Lowrance_USR(Dict[str, Any]):
     """
     Read a Lowrance USR file, creating a complex dict[str, Any] structure
     that reflects the header fields, waypoints, routes, event markers, and trails.
+
+    The :py:class:`Parser` for each format is built once and reused for all files.
     """
 
+    parsers: dict[int, Parser] = {}
+
+    @classmethod
+    def parser(cls, format: int) -> Parser:
+        """Returns the parser for the given format, building it if needed."""
+        if format not in cls.parsers:
+            if format == 2:  # pragma: no cover
+                raise NotImplementedError
+            elif format == 3:  # pragma: no cover
+                raise NotImplementedError
+            elif format == 4:  # pragma: no cover
+                raise NotImplementedError
+            elif format == 5:  # pragma: no cover
+                raise NotImplementedError
+            elif format == 6:
+                cls.parsers[format] = Parser(cls.format_6())
+            else:  # pragma: no cover
+                raise ValueError(f"Unkown format {format}")
+        return cls.parsers[format]
+
     @classmethod
     def format_6(cls) -> Field:
 
@@ -543,28 +647,35 @@ class Lowrance_USR(Dict[str, Any]):
         uc = UnpackContext(source)
         format = uc.peek(AtomicField("format", "<I"))
 
-        if format == 2:  # pragma: no cover
-            raise NotImplementedError
-        elif format == 3:  # pragma: no cover
-            raise NotImplementedError
-        elif format == 4:  # pragma: no cover
-            raise NotImplementedError
-        elif format == 5:  # pragma: no cover
-            raise NotImplementedError
-        elif format == 6:
-            usr_fields = cls.format_6()
-        else:  # pragma: no cover
-            raise ValueError(f"Unkown format {format}")
-
-        data = uc.extract(usr_fields)
+        data = cls.parser(format).parse(uc)
 
         if not uc.eof():  # pragma: no cover
             print("Warning: UNREAD BYTES")
-            extra = uc.source.read(128)
-            print(extra)
+            extra = uc.read(128)
+            print(bytes(extra))
 
         return Lowrance_USR(data)
 
+    @classmethod
+    def load_path(cls, path: Path) -> "Lowrance_USR":
+        """Opens and loads a USR file."""
+        with path.open("rb") as source:
+            return cls.load(source)
+
+    @classmethod
+    def load_many(
+        cls, paths: Iterable[Path], max_workers: Optional[int] = None
+    ) -> Iterator[tuple[Path, "Lowrance_USR"]]:
+        """
+        Loads a number of USR files with a pool of threads.
+
+        This overlaps the file reads, only. The parser is pure Python and holds the GIL,
+        so the parsing itself isn't any faster. The results are in the order of ``paths``.
+        """
+        path_list = list(paths)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            yield from zip(path_list, executor.map(cls.load_path, path_list))
+
 
 def t3() -> None:  # pragma: no cover
     plotter = Path.cwd() / "data" / "WaypointsRoutesTracks.usr"
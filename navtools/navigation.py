@@ -200,6 +200,9 @@ for range calculations.
 
     Mean radius of the earth in kilometers.
 
+The reciprocals, :py:data:`INV_NM`, :py:data:`INV_MI`, and :py:data:`INV_KM`,
+convert a distance to radians with a multiply instead of a divide.
+
 """
 
 from __future__ import annotations
@@ -210,15 +213,50 @@ from math import degrees
 
 from navtools import igrf, olc
 import datetime
+import functools
 import numbers
-import string
-from typing import Optional, Any, overload, Union, cast
-
+import sys
+from typing import Optional, Any, Callable, Iterable, Union, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from navtools._nav_kernels import (
+    HAVE_NUMBA,
+    rb_kernel,
+    rb_kernel_array,
+    destination_kernel,
+    destination_kernel_array,
+)
+
+_PI = math.pi
+_HALF_PI = math.pi / 2
+_QUARTER_PI = math.pi / 4
+_TWO_PI = math.tau
+_INV_TWO_PI = 1 / math.tau
 
 # The International Union of Geodesy and Geophysics (IUGG) defined mean radius values
 KM = 6371.009  # R in km
 MI = 3958.761  # R in mi
 NM = 3440.069  # R in nm, better value is 60*180/pi
+INV_KM, INV_MI, INV_NM = 1 / KM, 1 / MI, 1 / NM
+
+
+# The sign of a parsed hemisphere letter. The parser's optional group matches "" when it's absent.
+HEMISPHERE_SIGN = {
+    "N": +1,
+    "S": -1,
+    "E": +1,
+    "W": -1,
+    "n": +1,
+    "s": -1,
+    "e": +1,
+    "w": -1,
+    "": +1,
+}
+
+# The sign of the hemisphere argument to :py:meth:`Angle.fromdegrees`.
+FROMDEGREES_SIGN = {"N": +1, "S": -1, "E": +1, "W": -1, None: +1}
 
 
 class AngleParser:
@@ -234,47 +272,46 @@ class AngleParser:
     ValueError: Cannot parse 'Due North'
     """
 
-    dms_pat = re.compile(r"(\d+)\D+(\d+)\D+(\d+)[^NEWSnews]*([NEWSnews]?)")
-    dm_pat = re.compile(r"(\d+)\D+(\d+\.\d+)[^NEWSnews]*([NEWSnews]?)")
-    d_pat = re.compile(r"(\d+\.\d+)[^NEWSnews]*([NEWSnews]?)")
-    # This is identical to the dm_pat, above... It may change, however, so
-    # navx_dmh_pat = re.compile( r"(\d+)\D+(\d+\.\d+)[^NEWSnews]*([NEWSnews]?)" )
+    # One pattern with three alternatives, tried in order: d.ddd, d m.mmm, and d m s.
+    # Each is followed by an optional hemisphere.
+    # A navx_dmh pattern would be identical to the d m.mmm alternative.
+    parse_pat = re.compile(
+        r"(?:(?P<d>\d+\.\d+)"
+        r"|(?P<dm_d>\d+)\D+(?P<dm_m>\d+\.\d+)"
+        r"|(?P<dms_d>\d+)\D+(?P<dms_m>\d+)\D+(?P<dms_s>\d+))"
+        r"[^NEWSnews]*(?P<h>[NEWSnews]?)"
+    )
 
     @staticmethod
     def sign(txt: str) -> int:
-        return {"N": +1, "S": -1, "E": +1, "W": -1}.get(txt.upper(), +1)
+        return HEMISPHERE_SIGN.get(txt, +1)
 
     @staticmethod
     def parse(value: str) -> float:
         """
         Parses a text value, returning signed degrees as a float value.
 
+        The most common shape, :samp:`{ddd.ddd}{h}`, is handled without the regular expression.
+
         :param value: text to parse
         :returns: float degrees or a :py:exc:`ValueError` exception.
         """
+        d, dot, f = value.partition(".")
+        if dot and d.isdecimal() and f[:-1].isdecimal() and f[-1:] in HEMISPHERE_SIGN:
+            return HEMISPHERE_SIGN[f[-1:]] * float(value[:-1])
 
-        if d_match := AngleParser.d_pat.match(value):
-            deg = float(d_match.group(1))
-            return AngleParser.sign(d_match.group(2)) * deg
-
-        elif dm_match := AngleParser.dm_pat.match(value):
-            d, m = int(dm_match.group(1)), float(dm_match.group(2))
-            return AngleParser.sign(dm_match.group(3)) * (d + m / 60)
-
-        elif dms_match := AngleParser.dms_pat.match(value):
-            d, m, s = (
-                int(dms_match.group(1)),
-                int(dms_match.group(2)),
-                float(dms_match.group(3)),
-            )
-            return AngleParser.sign(dms_match.group(4)) * (d + m / 60 + s / 3600)
-
-        # elif navx_match := AngleParser.navx_dmh_pat.match( value ):
-        #     d_f, m_f = float(navx_match.group(1)), float(navx_match.group(2))
-        #     return AngleParser.sign(navx_match.group(3))*(d_f + m_f/60)
+        if not (match := AngleParser.parse_pat.match(value)):
+            raise ValueError("Cannot parse {0!r}".format(value))
 
+        d, dm_d, dm_m, dms_d, dms_m, dms_s, h = match.groups()
+        if d is not None:
+            deg = float(d)
+        elif dm_d is not None:
+            deg = int(dm_d) + float(dm_m) / 60
         else:
-            raise ValueError("Cannot parse {0!r}".format(value))
+            deg = int(dms_d) + int(dms_m) / 60 + float(dms_s) / 3600
+        # The h group is always one of the HEMISPHERE_SIGN keys, including "".
+        return HEMISPHERE_SIGN[h] * deg
 
 
 class Angle(float):
@@ -284,23 +321,7 @@ class Angle(float):
     In that sense, they aren't completely generic angles; they're restricted in their
     meaning.
 
-    Currently, we extend ``float``. This leads to the following
-
-        DeprecationWarning: Angle.__float__ returned non-float (type Angle).
-        The ability to return an instance of a strict subclass of float is deprecated,
-        and may be removed in a future version of Python.
-
-    This suggests we need to switch to a separate class that implements ``numbers.Real``.
-    This would "wrap" the internal ``float`` object.
-
-    ::
-
-        class Angle(numbers.Real):
-            def __init__(self, value: float) -> None:
-                self.value = value
-            def __add__(self, other: Any) -> Angle:
-                return self.value + cast(Angle, other).value
-            etc.
+    We extend ``float``. The value is in radians.
 
     This class has lots of conversions to DMS.
     A subclass can treat the sign ("h") as the hemisphere,
@@ -356,9 +377,13 @@ class Angle(float):
     We define the core numeric object special methods, all of which simply appeal to the superclass
     methods for the implementation. The results create new :class:`Angle` objects,
     otherwise, we behave just like a :class:`float`.
+    ``float()`` of an :class:`Angle` is a plain :class:`float`.
 
     """
 
+    # No per-instance __dict__: an Angle is just the float.
+    __slots__ = ()
+
     # The default parser for Lat or Lon values.
     parser = AngleParser
 
@@ -380,11 +405,9 @@ class Angle(float):
         >>> round(b, 4)
         0.4094
         """
-        if hemisphere in ("N", "E", None):
-            sign = +1
-        elif hemisphere in ("S", "W"):
-            sign = -1
-        else:
+        try:
+            sign = FROMDEGREES_SIGN[hemisphere]
+        except KeyError:
             raise ValueError(f"Can't create Angle from {deg!r}, {hemisphere!r}")
         return cls(math.radians(sign * deg))
 
@@ -439,6 +462,41 @@ class Angle(float):
             pass
         raise ValueError(f"Cannot parse {value!r}")
 
+    @classmethod
+    def fromstrings(cls, values: Iterable[str]) -> NDArray[np.float64]:
+        """
+        Converts a column of string values to an array of radians.
+        This is for bulk loads, where the :py:class:`Angle` objects
+        are often not needed.
+
+        A column of simple float strings is converted by NumPy in one step.
+        Otherwise, each value is parsed the way :py:meth:`fromstring` does,
+        without building the intermediate :py:class:`Angle` objects.
+
+        :param values: string degrees values.
+        :returns: ``float64`` array of radians.
+
+        >>> Angle.fromstrings(["-77.4325", "37.4689"]).round(4)
+        array([-1.3515,  0.654 ])
+        >>> Angle.fromstrings(["37°28'8\\"N", "77°25′57″W"]).round(4)
+        array([ 0.654 , -1.3515])
+        """
+        text = list(values)
+        try:
+            return np.radians(np.array(text, dtype=np.float64))
+        except ValueError:
+            pass
+
+        def degrees(value: str) -> float:
+            try:
+                return float(value)
+            except ValueError:
+                return cls.parser.parse(value)
+
+        return np.radians(
+            np.fromiter(map(degrees, text), dtype=np.float64, count=len(text))
+        )
+
     @classmethod
     def parse(cls, value: str) -> "Angle":
         """Alias for :py:meth:`fromstring`"""
@@ -472,32 +530,29 @@ class Angle(float):
     @property
     def dm(self) -> tuple[float, float]:
         """:returns: (d, m) tuple of signed values"""
-        sign = -1 if self < 0 else +1
-        ad = abs(self.deg)
+        deg = math.degrees(self)
+        ad = abs(deg)
         d = int(ad)
         ms = 60 * (ad - d)
         if abs(ms - 60) / 60 < 1e-5:
             ms = 0.0
             d += 1
-        return d * sign, ms * (sign if d == 0 else 1)
+        if deg >= 0:
+            return d, ms
+        return -d, (-ms if d == 0 else ms)
 
     @property
     def dms(self) -> tuple[float, float, float]:
         """:returns: (d, m, s) tuple of signed values"""
-        sign = -1 if self < 0 else +1
-        ad = abs(self.deg)
-        d = int(ad)
-        ms = 60 * (ad - d)
-        if abs(ms - 60) / 60 < 1e-5:
-            ms = 0.0
-            d += 1
-        m = int(ms)
-        s = round((ms - m) * 60, 3)
-        return (
-            d * sign,
-            m * (sign if d == 0 else 1),
-            s * (sign if d == 0 and m == 0 else 1),
-        )
+        deg = math.degrees(self)
+        # Split integer milliseconds; round-off can't leave 59.999... seconds.
+        d, ms = divmod(round(abs(deg) * 3_600_000), 3_600_000)
+        m, ms = divmod(ms, 60_000)
+        s = ms / 1000
+        if deg >= 0:
+            return d, m, s
+        # Only the leading non-zero field carries the sign.
+        return -d, (-m if d == 0 else m), (-s if d == 0 and m == 0 else s)
 
     @property
     def h(self) -> str:
@@ -511,15 +566,19 @@ class Angle(float):
         return "-" if self < 0 else "+"
 
     spec_pat = re.compile(r"%([0-9\.#\+ -]*)([dmshr])")
-    formatter = string.Formatter()
 
     @classmethod
-    def _rewrite(cls, spec: str) -> tuple[str, set[str]]:
+    @functools.lru_cache(maxsize=128)
+    def _rewrite(cls, spec: str) -> tuple[str, frozenset[str]]:
         """
         Rewrites a "%x" spec into a "{x:fmt}" format.
         Returns the revised format at the set of properties
         used.
 
+        An application tends to use a few specs over and over again,
+        so the results are cached. The set of properties is a :py:class:`frozenset`
+        so the cached value can be shared safely.
+
         There are several variant cases where we want
         different kinds of display values:
 
@@ -533,26 +592,20 @@ class Angle(float):
         and determine the appropriate mix of int or float values to include.
         """
         if spec is None or spec == "" or spec == "s":
-            return "{d:f}", {"d"}
+            return "{d:f}", frozenset({"d"})
         else:
             used: set[str] = set()
-            m = cls.spec_pat.search(spec)
-            # pattern group 0 is the detailed spec
-            # pattern group 1 is the 1-letter property (d, m, s, h, or r)
-            while m:
-                # Rewrite this item in the spec.
+
+            def rewrite(m: re.Match[str]) -> str:
+                # pattern group 1 is the detailed spec
+                # pattern group 2 is the 1-letter property (d, m, s, h, or r)
                 fmt, prop = m.groups()
-                spec = cls.spec_pat.sub(
-                    "{{{prop}:{fmt}{tp}}}".format(
-                        prop=prop, fmt=fmt, tp="s" if prop == "h" else "f"
-                    ),
-                    spec,
-                    count=1,
-                )
                 used.add(prop)
-                # "Recursively" check for more items.
-                m = cls.spec_pat.search(spec)
-        return spec, used
+                return f"{{{prop}:{fmt}{'s' if prop == 'h' else 'f'}}}"
+
+            # One pass; a replacement never contains "%", so it can't create a new item.
+            spec = cls.spec_pat.sub(rewrite, spec)
+        return spec, frozenset(used)
 
     def __format__(self, spec: str = "") -> str:
         """
@@ -571,22 +624,43 @@ class Angle(float):
 
         We have an internal function, :meth:`_rewrite()`, which will parse a format specification
         and then rebuild the format spec into something a bit more useful.
-        Once the format has been rewritten we can use the :class:`string.Formatter`
+        Once the format has been rewritten we can use :py:meth:`str.format_map`
         to build the resulting output.
 
         :class spec: format specification for this value.
         :returns: text representation of this :class:`Angle`.
         :meta public:
         """
-        fmt_str, prop_set = self._rewrite(spec)
-        data = dict(h=self.h, r=self.radians)
+        return self.format_prepared(self._rewrite(spec))
+
+    def format_prepared(self, prepared: tuple[str, frozenset[str]]) -> str:
+        """
+        Formatted string representation of an Angle, using a specification
+        already rewritten by :meth:`_rewrite()`.
+        This lets an application rewrite a format it uses often just once.
+
+        >>> import math
+        >>> prepared = Angle._rewrite("%02.0d %02.0m")
+        >>> Angle(math.pi/6).format_prepared(prepared)
+        '30 00'
+
+        :param prepared: the ``(fmt_str, prop_set)`` result from :meth:`_rewrite()`.
+        :returns: text representation of this :class:`Angle`.
+        """
+        fmt_str, prop_set = prepared
+        # Only compute the values the format uses.
+        data: dict[str, Any] = {}
+        if "h" in prop_set:
+            data["h"] = self.h
+        if "r" in prop_set:
+            data["r"] = self.radians
         if {"d", "m", "s"} <= prop_set:
             data["d"], data["m"], data["s"] = Angle(abs(self)).dms
         elif {"d", "m"} <= prop_set and not {"s"} <= prop_set:
             data["d"], data["m"] = Angle(abs(self)).dm
         elif {"d"} <= prop_set and not {"m", "s"} <= prop_set:
             data["d"] = abs(self.degrees)
-        return self.formatter.format(fmt_str, **data)
+        return fmt_str.format_map(data)
 
     def __add__(self, other: Any) -> "Angle":
         """:meta public:"""
@@ -612,10 +686,6 @@ class Angle(float):
         """:meta public:"""
         return Angle(super().__mod__(other))
 
-    def __pow__(self, other: Any, mod: None = None) -> float:
-        """:meta public:"""
-        return super().__pow__(other)
-
     def __radd__(self, other: Any) -> "Angle":
         """:meta public:"""
         return Angle(super().__radd__(other))
@@ -640,32 +710,10 @@ class Angle(float):
         """:meta public:"""
         return Angle(super().__rmod__(other))
 
-    def __rpow__(self, other: Any, mod: None = None) -> float:
-        """:meta public:"""
-        return super().__rpow__(other)
-
     def __abs__(self) -> "Angle":
         """:meta public:"""
         return Angle(super().__abs__())
 
-    def __float__(self) -> float:
-        """:meta public:"""
-        return self
-
-    @overload
-    def __round__(self, ndigits: None = None) -> int:
-        ...  # pragma: no cover
-
-    @overload
-    def __round__(self, ndigits: int) -> float:
-        ...  # pragma: no cover
-
-    def __round__(self, ndigits: Optional[int] = None) -> Union[int, float]:
-        """:meta public:"""
-        if ndigits is None:
-            return super().__round__()
-        return super().__round__(ndigits)
-
     def __neg__(self) -> "Angle":
         """:meta public:"""
         return Angle(super().__neg__())
@@ -674,34 +722,6 @@ class Angle(float):
         """:meta public:"""
         return self
 
-    def __eq__(self, other: Any) -> bool:
-        """:meta public:"""
-        return super().__eq__(other)
-
-    def __ne__(self, other: Any) -> bool:
-        """:meta public:"""
-        return super().__ne__(other)
-
-    def __le__(self, other: Any) -> bool:
-        """:meta public:"""
-        return super().__le__(other)
-
-    def __lt__(self, other: Any) -> bool:
-        """:meta public:"""
-        return super().__lt__(other)
-
-    def __ge__(self, other: Any) -> bool:
-        """:meta public:"""
-        return super().__ge__(other)
-
-    def __gt__(self, other: Any) -> bool:
-        """:meta public:"""
-        return super().__gt__(other)
-
-    def __hash__(self) -> int:
-        """:meta public:"""
-        return super().__hash__()
-
 
 class Lat(Angle):
     """Latitude Angle, normal to the equator.
@@ -717,6 +737,8 @@ class Lat(Angle):
     37.1234
     """
 
+    __slots__ = ()
+
     @classmethod
     def fromdegrees(cls, deg: float, hemisphere: Optional[str] = None) -> "Lat":
         return Lat(super().fromdegrees(deg, hemisphere))
@@ -736,7 +758,8 @@ class Lat(Angle):
         return "S" if self < 0 else "N"
 
     def __repr__(self) -> str:
-        return "{0:%02.0d°%06.3m′%h}".format(self)
+        d, m = self.dm
+        return f"{abs(d):02.0f}°{abs(m):06.3f}′{self.h}"
 
     @property
     def north(self) -> float:
@@ -744,7 +767,7 @@ class Lat(Angle):
         :returns: North latitude, positive "co-latitude".
             Range is 0 to pi instead of -pi/2 to +pi/2.
         """
-        return self + math.pi / 2
+        return float(self) + _HALF_PI
 
 
 class Lon(Angle):
@@ -761,6 +784,8 @@ class Lon(Angle):
     -76.5678
     """
 
+    __slots__ = ()
+
     @classmethod
     def fromdegrees(cls, deg: float, hemisphere: Optional[str] = None) -> "Lon":
         return Lon(super().fromdegrees(deg, hemisphere))
@@ -780,12 +805,33 @@ class Lon(Angle):
         return "W" if self < 0 else "E"
 
     def __repr__(self) -> str:
-        return "{0:%03.0d°%06.3m′%h}".format(self)
+        d, m = self.dm
+        return f"{abs(d):03.0f}°{abs(m):06.3f}′{self.h}"
 
     @property
     def east(self) -> float:
         """:returns: East longitude. Positive only."""
-        return (self + math.pi * 2) % (math.pi * 2)
+        r = float(self)
+        return r if 0.0 <= r < _TWO_PI else r % _TWO_PI
+
+
+# Conversions to Lat or Lon for the most common exact types of LatLon arguments.
+LAT_FROM_TYPE: dict[type, Callable[[Any], Lat]] = {
+    Lat: lambda lat: lat,
+    Lon: Lat,
+    Angle: Lat,
+    float: lambda lat: Lat(math.radians(lat)),
+    int: lambda lat: Lat(math.radians(lat)),
+    str: Lat.fromstring,
+}
+LON_FROM_TYPE: dict[type, Callable[[Any], Lon]] = {
+    Lon: lambda lon: lon,
+    Lat: Lon,
+    Angle: Lon,
+    float: lambda lon: Lon(math.radians(lon)),
+    int: lambda lon: Lon(math.radians(lon)),
+    str: Lon.fromstring,
+}
 
 
 class LatLon:
@@ -806,34 +852,98 @@ class LatLon:
     :ivar d: A pair of D strings.
     """
 
+    __slots__ = ("_lat", "_lon", "_lat_r", "_lon_r")
+
     def __init__(
         self, lat: Union[Lat, Angle, float, str], lon: Union[Lon, Angle, float, str]
     ) -> None:
         """Build a LatLon from two values.
 
-        :param lat: the latitude, used to build an Angle. A float is presumed to be in degrees.
-        :param lon: the longitude, used to build an Angle. A float is presumed to be in degrees.
+        :param lat: the latitude, used to build an Angle. A float or int is presumed to be in degrees.
+        :param lon: the longitude, used to build an Angle. A float or int is presumed to be in degrees.
         """
-        if isinstance(lat, Lat):
-            self.lat = lat
+        # Look up the exact type first; subclasses use the isinstance() checks.
+        if convert_lat := LAT_FROM_TYPE.get(type(lat)):
+            self._lat = convert_lat(lat)
+        elif isinstance(lat, Lat):
+            self._lat = lat
         elif isinstance(lat, Angle):
-            self.lat = Lat(lat)
+            self._lat = Lat(lat)
         elif isinstance(lat, float):
-            self.lat = Lat.fromdegrees(lat)
+            self._lat = Lat.fromdegrees(lat)
         elif isinstance(lat, str):
-            self.lat = Lat.fromstring(lat)
+            self._lat = Lat.fromstring(lat)
         else:
             raise ValueError("Can't convert {0!r}".format(lat))
-        if isinstance(lon, Lon):
-            self.lon = lon
+        if convert_lon := LON_FROM_TYPE.get(type(lon)):
+            self._lon = convert_lon(lon)
+        elif isinstance(lon, Lon):
+            self._lon = lon
         elif isinstance(lon, Angle):
-            self.lon = Lon(lon)
+            self._lon = Lon(lon)
         elif isinstance(lon, float):
-            self.lon = Lon.fromdegrees(lon)
+            self._lon = Lon.fromdegrees(lon)
         elif isinstance(lon, str):
-            self.lon = Lon.fromstring(lon)
+            self._lon = Lon.fromstring(lon)
         else:
             raise ValueError("Can't convert {0!r}".format(lon))
+        # Plain float radians, used by the range and bearing calculations.
+        self._lat_r = float(self._lat)
+        self._lon_r = float(self._lon)
+
+    @classmethod
+    def from_radians(cls, lat: float, lon: float) -> "LatLon":
+        """Build a LatLon from float radians, without the type checks of ``__init__``.
+
+        >>> p = LatLon.from_radians(math.radians(37.5), math.radians(-76.25))
+        >>> p.d
+        ('37.500N', '076.250W')
+
+        :param lat: the latitude in radians.
+        :param lon: the longitude in radians.
+        :returns: a :py:class:`LatLon`.
+        """
+        self = cls.__new__(cls)
+        self._lat_r = float(lat)
+        self._lon_r = float(lon)
+        self._lat = Lat(self._lat_r)
+        self._lon = Lon(self._lon_r)
+        return self
+
+    @classmethod
+    def from_degrees(cls, lat: float, lon: float) -> "LatLon":
+        """Build a LatLon from float degrees, without the type checks of ``__init__``.
+
+        >>> LatLon.from_degrees(37.5, -76.25).d
+        ('37.500N', '076.250W')
+
+        :param lat: the latitude in signed degrees.
+        :param lon: the longitude in signed degrees.
+        :returns: a :py:class:`LatLon`.
+        """
+        return cls.from_radians(math.radians(lat), math.radians(lon))
+
+    @property
+    def lat(self) -> Lat:
+        """The latitude."""
+        return self._lat
+
+    @lat.setter
+    def lat(self, value: Lat) -> None:
+        # Keep the cached radians in step with the Lat.
+        self._lat = value
+        self._lat_r = float(value)
+
+    @property
+    def lon(self) -> Lon:
+        """The longitude."""
+        return self._lon
+
+    @lon.setter
+    def lon(self, value: Lon) -> None:
+        # Keep the cached radians in step with the Lon.
+        self._lon = value
+        self._lon_r = float(value)
 
     lat_dms_format = "{0:%02.0d %02.0m %04.1s%h}"
     lon_dms_format = "{0:%03.0d %02.0m %04.1s%h}"
@@ -842,14 +952,25 @@ class LatLon:
     lat_d_format = "{0:%06.3d%h}"
     lon_d_format = "{0:%07.3d%h}"
 
+    # The Angle specs inside each "{0:...}" format, rewritten once.
+    # The properties below fill in these format strings directly.
+    lat_dms_prepared = Angle._rewrite(lat_dms_format[3:-1])
+    lon_dms_prepared = Angle._rewrite(lon_dms_format[3:-1])
+    lat_dm_prepared = Angle._rewrite(lat_dm_format[3:-1])
+    lon_dm_prepared = Angle._rewrite(lon_dm_format[3:-1])
+    lat_d_prepared = Angle._rewrite(lat_d_format[3:-1])
+    lon_d_prepared = Angle._rewrite(lon_d_format[3:-1])
+
     @property
     def dms(self) -> tuple[str, str]:
         """Long Degree Minute Second format.
 
         :returns: A pair of strings of the form :samp:`{ddd} {mm} {s.s}{h}`
         """
-        lat = LatLon.lat_dms_format.format(self.lat)
-        lon = LatLon.lon_dms_format.format(self.lon)
+        d, m, s = Angle(abs(self.lat)).dms
+        lat = LatLon.lat_dms_prepared[0].format(d=d, m=m, s=s, h=self.lat.h)
+        d, m, s = Angle(abs(self.lon)).dms
+        lon = LatLon.lon_dms_prepared[0].format(d=d, m=m, s=s, h=self.lon.h)
         return (lat, lon)
 
     @property
@@ -858,8 +979,10 @@ class LatLon:
 
         :returns: A pair of strings of the form :samp:`{ddd} {m.mmm}{h}`
         """
-        lat = LatLon.lat_dm_format.format(self.lat)
-        lon = LatLon.lon_dm_format.format(self.lon)
+        d, m = Angle(abs(self.lat)).dm
+        lat = LatLon.lat_dm_prepared[0].format(d=d, m=m, h=self.lat.h)
+        d, m = Angle(abs(self.lon)).dm
+        lon = LatLon.lon_dm_prepared[0].format(d=d, m=m, h=self.lon.h)
         return (lat, lon)
 
     @property
@@ -868,8 +991,8 @@ class LatLon:
 
         :returns: A pair of strings of the form :samp:`{ddd.ddd}{h}`
         """
-        lat = LatLon.lat_d_format.format(self.lat)
-        lon = LatLon.lon_d_format.format(self.lon)
+        lat = LatLon.lat_d_prepared[0].format(d=abs(self.lat.degrees), h=self.lat.h)
+        lon = LatLon.lon_d_prepared[0].format(d=abs(self.lon.degrees), h=self.lon.h)
         return (lat, lon)
 
     def __str__(self) -> str:
@@ -883,10 +1006,38 @@ class LatLon:
         Distance from another point.
         This can be expensive to compute, a geocode
         to do proximity tests can be more efficient.
+
+        To compare one point with many others, see :py:meth:`prepare_near`.
         """
-        r, b = range_bearing(self, other, R=R)
+        r, _ = rb_kernel(self._lat_r, self._lon_r, other._lat_r, other._lon_r, float(R))
         return r
 
+    def prepare_near(self, R: float = NM) -> Callable[["LatLon"], float]:
+        """
+        A function for the distance from this point to other points.
+        This is the same distance as :py:meth:`near`,
+        without the bearing, and with this point's values extracted once.
+
+        >>> here = LatLon(37.549033, -76.328957)
+        >>> distance = here.prepare_near()
+        >>> round(distance(LatLon(37.2678, -76.0178)), 3)
+        22.48
+
+        :param R: radius of the earth in appropriate units;
+            default is nautical miles.
+        :returns: A function that takes a :py:class:`LatLon` and returns a distance.
+        """
+        lat1, lon1, radius = self._lat_r, self._lon_r, float(R)
+        cos, hypot, floor = math.cos, math.hypot, math.floor
+
+        def distance(other: "LatLon") -> float:
+            lat2 = other._lat_r
+            dlon = other._lon_r - lon1
+            dlon -= _TWO_PI * floor((dlon + _PI) * _INV_TWO_PI)
+            return radius * hypot(lat2 - lat1, cos((lat2 + lat1) / 2) * dlon)
+
+        return distance
+
 
 def range_bearing(p1: LatLon, p2: LatLon, R: float = NM) -> tuple[float, Angle]:
     """Rhumb-line course from :py:data:`p1` to :py:data:`p2`.
@@ -904,16 +1055,190 @@ def range_bearing(p1: LatLon, p2: LatLon, R: float = NM) -> tuple[float, Angle]:
     :returns: 2-tuple of range and bearing from p1 to p2.
 
     """
-    d_NS = R * (p2.lat.radians - p1.lat.radians)
-    d_EW = (
-        R
-        * math.cos((p2.lat.radians + p1.lat.radians) / 2)
-        * (p2.lon.radians - p1.lon.radians)
-    )
-    d = math.hypot(d_NS, d_EW)
-    tc = math.atan2(d_EW, d_NS) % (2 * math.pi)
-    theta = Angle(tc)
-    return d, theta
+    d, tc = range_bearing_raw(p1, p2, R)
+    return d, Angle(tc)
+
+
+def range_bearing_raw(p1: LatLon, p2: LatLon, R: float = NM) -> tuple[float, float]:
+    """Rhumb-line course from :py:data:`p1` to :py:data:`p2`, as plain floats.
+
+    This is :py:func:`range_bearing` without creating an :py:class:`Angle`,
+    for a caller that only needs the distance, or the bearing in radians.
+
+    >>> d, tc = range_bearing_raw(LatLon(37.549033, -76.328957), LatLon(37.2678, -76.0178))
+    >>> round(d, 3), round(math.degrees(tc), 3)
+    (22.48, 138.69)
+
+    :param p1: a :py:class:`LatLon` starting point
+    :param p2: a :py:class:`LatLon` ending point
+    :param R: radius of the earth in appropriate units;
+        default is nautical miles.
+    :returns: 2-tuple of range and bearing (in radians) from p1 to p2.
+    """
+    return rb_kernel(p1._lat_r, p1._lon_r, p2._lat_r, p2._lon_r, float(R))
+
+
+def _broadcast_ravel(
+    *arrays: Any,
+) -> tuple[tuple[int, ...], list[NDArray[np.float64]]]:
+    """
+    Broadcasts the arguments to a common shape.
+    Returns the shape and the 1-D float64 arrays for a kernel.
+    """
+    shape = np.broadcast_shapes(*(np.shape(a) for a in arrays))
+    flat = [
+        np.broadcast_to(np.asarray(a, dtype=np.float64), shape).ravel() for a in arrays
+    ]
+    return shape, flat
+
+
+def range_bearing_array(
+    lat1: NDArray[np.float64],
+    lon1: NDArray[np.float64],
+    lat2: NDArray[np.float64],
+    lon2: NDArray[np.float64],
+    R: float = NM,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Rhumb-line courses for arrays of points.
+
+    This is the vectorized form of :py:func:`range_bearing`.
+    Each array is of latitudes or longitudes in radians.
+    The arrays must have compatible shapes; a single starting point
+    can be broadcast against arrays of ending points.
+
+    When Numba is installed, this uses a compiled kernel.
+
+    :param lat1: starting point latitudes
+    :param lon1: starting point longitudes
+    :param lat2: ending point latitudes
+    :param lon2: ending point longitudes
+    :param R: radius of the earth in appropriate units;
+        default is nautical miles.
+    :returns: 2-tuple of arrays of ranges and bearings (in radians).
+
+    >>> lat = np.radians([37.549033, 37.2678])
+    >>> lon = np.radians([-76.328957, -76.0178])
+    >>> d, tc = range_bearing_array(lat[:-1], lon[:-1], lat[1:], lon[1:])
+    >>> np.round(d, 3)
+    array([22.48])
+    >>> np.round(np.degrees(tc), 3)
+    array([138.69])
+    """
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lat2 = np.asarray(lat2, dtype=np.float64)
+    lon2 = np.asarray(lon2, dtype=np.float64)
+    if HAVE_NUMBA:
+        shape, (lat1_f, lon1_f, lat2_f, lon2_f) = _broadcast_ravel(
+            lat1, lon1, lat2, lon2
+        )
+        d, tc = rb_kernel_array(lat1_f, lon1_f, lat2_f, lon2_f, float(R))
+        return d.reshape(shape), tc.reshape(shape)
+    dlon = np.subtract(lon2, lon1)
+    dlon = dlon - _TWO_PI * np.floor((dlon + _PI) * _INV_TWO_PI)
+    d_NS = R * (lat2 - lat1)
+    d_EW = R * np.cos((lat2 + lat1) / 2) * dlon
+    d = np.hypot(d_NS, d_EW)
+    tc = np.arctan2(d_EW, d_NS)
+    tc = np.where(tc < 0.0, tc + _TWO_PI, tc)
+    return d, tc
+
+
+@dataclass(eq=False)
+class LatLonArray:
+    """
+    A sequence of points, like a route or a track, as two arrays of radians.
+    This supports computing all of the legs at once with :py:func:`range_bearing_array`.
+
+    :ivar lat: ``float64`` array of latitudes in radians.
+    :ivar lon: ``float64`` array of longitudes in radians.
+
+    >>> route = LatLonArray.from_latlons(
+    ...     [LatLon(37.549033, -76.328957), LatLon(37.2678, -76.0178), LatLon(37.1, -76.0)]
+    ... )
+    >>> len(route)
+    3
+    >>> np.round(route.cumulative_range(), 3)
+    array([22.48, 32.59])
+    """
+
+    lat: NDArray[np.float64]
+    lon: NDArray[np.float64]
+
+    @classmethod
+    def from_latlons(cls, points: Iterable[LatLon]) -> "LatLonArray":
+        """
+        Packs :py:class:`LatLon` objects into arrays.
+
+        :param points: iterable of :py:class:`LatLon` points.
+        :returns: :py:class:`LatLonArray`
+        """
+        coordinates = [(p._lat_r, p._lon_r) for p in points]
+        packed = np.array(coordinates, dtype=np.float64).reshape(-1, 2)
+        return cls(packed[:, 0].copy(), packed[:, 1].copy())
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def range_bearing(
+        self, R: float = NM
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Range and bearing of each leg, from each point to the next.
+
+        :param R: radius of the earth in appropriate units;
+            default is nautical miles.
+        :returns: 2-tuple of arrays of ranges and bearings (in radians),
+            one shorter than this array of points.
+        """
+        return range_bearing_array(
+            self.lat[:-1], self.lon[:-1], self.lat[1:], self.lon[1:], R
+        )
+
+    def cumulative_range(self, R: float = NM) -> NDArray[np.float64]:
+        """
+        Distance run at the end of each leg.
+
+        :param R: radius of the earth in appropriate units;
+            default is nautical miles.
+        :returns: array of distances, one shorter than this array of points.
+        """
+        d, _ = self.range_bearing(R)
+        return np.cumsum(d)
+
+    def destination(
+        self, range: Any, bearing: Any, R: float = NM
+    ) -> "LatLonArray":
+        """
+        Rhumb line destinations from each point, using :py:func:`destination_array`.
+
+        >>> start = LatLonArray.from_latlons([LatLon(51.127, 1.338)])
+        >>> end = start.destination(np.array([40.23, 80.46]), 116.7, R=KM)
+        >>> np.round(np.degrees(end.lat), 3)
+        array([50.964, 50.802])
+
+        :param range: the distance to travel from each point;
+            a single value or an array that broadcasts against the points.
+        :param bearing: the direction of travel in degrees; also a value or an array.
+        :param R: radius of the earth in appropriate units;
+            default is nautical miles.
+        :returns: a :py:class:`LatLonArray` of the ending points.
+        """
+        lat2, lon2 = destination_array(self.lat, self.lon, range, bearing, R)
+        return LatLonArray(lat2, lon2)
+
+    def declination(self, date: Optional[datetime.date] = None) -> NDArray[np.float64]:
+        """
+        Standard declination at each point, using :py:func:`declination_array`.
+
+        >>> points = LatLonArray.from_latlons([LatLon(37.8311, -76.2819), LatLon(0.0, 0.0)])
+        >>> np.round(np.degrees(points.declination(datetime.date(2012, 4, 18))), 1)
+        array([-11. ,  -5.8])
+
+        :param date: :py:class:`datetime.date` in question, default is today.
+        :returns: array of declinations (in radians).
+        """
+        return declination_array(self.lat, self.lon, date)
 
 
 def destination(p1: LatLon, range: float, bearing: float, R: float = NM) -> LatLon:
@@ -930,27 +1255,79 @@ def destination(p1: LatLon, range: float, bearing: float, R: float = NM) -> LatL
         :py:data:`MI` for statute miles and :py:data:`NM` for nautical miles.
     :returns: a :py:class:`LatLon` with the ending point.
     """
-    d = range / R
-    theta = math.radians(bearing)
-    lat1 = p1.lat.radians
-    lon1 = p1.lon.radians
-    lat2 = lat1 + d * math.cos(theta)
-    # check for some daft bugger going past the pole, normalize latitude if so
-    if abs(lat2) > math.pi / 2:
-        lat2 = math.pi - lat2 if lat2 > 0 else -(math.pi - lat2)
+    lat2, lon2 = destination_kernel(
+        p1._lat_r, p1._lon_r, range / R, math.radians(bearing)
+    )
+    return LatLon.from_radians(lat2, lon2)
+
+
+def destination_array(
+    lat1: NDArray[np.float64],
+    lon1: NDArray[np.float64],
+    range: NDArray[np.float64],
+    bearing: NDArray[np.float64],
+    R: float = NM,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Rhumb line destinations for arrays of points, ranges and bearings.
+
+    This is the vectorized form of :py:func:`destination`.
+    The latitudes and longitudes are in radians; the bearings are in degrees,
+    like :py:func:`destination`.
+    The arrays must have compatible shapes; a single starting point
+    can be broadcast against arrays of ranges and bearings.
+
+    When Numba is installed, this uses a compiled kernel.
+
+    :param lat1: starting point latitudes
+    :param lon1: starting point longitudes
+    :param range: the distances to travel.
+    :param bearing: the directions of travel in degrees.
+    :param R: radius of the earth in appropriate units;
+        default is nautical miles.
+    :returns: 2-tuple of arrays of ending latitudes and longitudes (in radians).
+
+    >>> lat2, lon2 = destination_array(
+    ...     np.radians(51.127), np.radians(1.338), np.array([40.23]), np.array([116.7]), R=KM
+    ... )
+    >>> np.round(np.degrees(lat2), 4), np.round(np.degrees(lon2), 4)
+    (array([50.9644]), array([1.8521]))
+    """
+    # One division for the batch, then a multiply for each range.
+    d = np.asarray(range, dtype=np.float64) * (1 / R)
+    theta = np.radians(bearing)
+    if HAVE_NUMBA:
+        shape, (lat1_f, lon1_f, d_f, theta_f) = _broadcast_ravel(lat1, lon1, d, theta)
+        lat2, lon2 = destination_kernel_array(lat1_f, lon1_f, d_f, theta_f)
+        return lat2.reshape(shape), lon2.reshape(shape)
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lat2 = lat1 + d * np.cos(theta)
+    # Same pole normalization as the scalar kernel.
+    lat2 = np.where(
+        np.abs(lat2) > _HALF_PI,
+        np.where(lat2 > 0, _PI - lat2, -(_PI - lat2)),
+        lat2,
+    )
     dLat = lat2 - lat1
-    if abs(dLat) < 1.0e-6:
-        q = math.cos(lat1)
-    else:
-        dPhi = math.log(
-            math.tan(lat2 / 2 + math.pi / 4) / math.tan(lat1 / 2 + math.pi / 4)
-        )
-        q = dLat / dPhi
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dPhi = np.log(np.tan(lat2 / 2 + _QUARTER_PI) / np.tan(lat1 / 2 + _QUARTER_PI))
+        q = np.where(np.abs(dLat) < 1.0e-6, np.cos(lat1), dLat / dPhi)
+    dLon = d * np.sin(theta) / q
+    t = lon1 + dLon
+    lon2 = t - _TWO_PI * np.floor((t + _PI) * _INV_TWO_PI)
+    return lat2, lon2
 
-    dLon = d * math.sin(theta) / q
-    lon2 = ((lon1 + dLon + math.pi) % (2 * math.pi)) - math.pi
 
-    return LatLon(Lat(lat2), Lon(lon2))
+@functools.lru_cache(maxsize=64)
+def _astro_dt_tm(year: int, ordinal: int) -> float:
+    """
+    The floating-point year used by the IGRF model; a track has few distinct dates.
+    The key is the day, so a ``datetime`` hits the cache all day long.
+    """
+    # The ordinal of January 1st, the same as ``date(year, 1, 1).toordinal()``.
+    y = year - 1
+    first_of_year = 365 * y + y // 4 - y // 100 + y // 400 + 1
+    return year + (ordinal - first_of_year) / 365.242
 
 
 def declination(point: LatLon, date: Optional[datetime.date] = None) -> float:
@@ -970,16 +1347,59 @@ def declination(point: LatLon, date: Optional[datetime.date] = None) -> float:
     # print( "declination: {0!r} {1!r}".format(point.lat, point.lon) )
 
     if date is None:
-        date = datetime.datetime.today()
-    first_of_year = date.replace(month=1, day=1)
-    astro_dt_tm = date.year + (date.toordinal() - first_of_year.toordinal()) / 365.242
+        date = datetime.date.today()
+    astro_dt_tm = _astro_dt_tm(date.year, date.toordinal())
 
     x, y, z, f = igrf.igrfsyn(astro_dt_tm, point.lat, point.lon.east)
     decl = math.atan2(y, x)  # Declination
     return decl
 
 
-@dataclass(eq=True, unsafe_hash=True)
+def declination_array(
+    lat: NDArray[np.float64],
+    lon: NDArray[np.float64],
+    date: Optional[datetime.date] = None,
+) -> NDArray[np.float64]:
+    """Computes standard declination for arrays of points.
+
+    This is the vectorized form of :py:func:`declination`.
+    The latitudes and longitudes are in radians.
+    The arrays must have compatible shapes.
+
+    The date-dependent part of the model is computed once for the batch.
+    The IGRF synthesis is scalar, so each point is still one call
+    to :py:data:`igrf.igrfsyn`; the final ``arctan2`` is vectorized.
+
+    :param lat: latitudes
+    :param lon: longitudes
+    :param date: :py:class:`datetime.date` in question, default is today.
+    :returns: array of declinations (in radians).
+
+    >>> decl = declination_array(
+    ...     np.radians([37.8311, 0.0]), np.radians([-76.2819, 0.0]),
+    ...     date=datetime.date(2012, 4, 18)
+    ... )
+    >>> np.round(np.degrees(decl), 1)
+    array([-11. ,  -5.8])
+    """
+    if date is None:
+        date = datetime.date.today()
+    astro_dt_tm = _astro_dt_tm(date.year, date.toordinal())
+
+    shape, (lat_f, lon_f) = _broadcast_ravel(lat, lon)
+    east = lon_f % _TWO_PI
+    x = np.empty(lat_f.size, dtype=np.float64)
+    y = np.empty(lat_f.size, dtype=np.float64)
+    for i, (nlat, elong) in enumerate(zip(lat_f.tolist(), east.tolist())):
+        x[i], y[i], _, _ = igrf.igrfsyn(astro_dt_tm, nlat, elong)
+    return np.arctan2(y, x).reshape(shape)
+
+
+# Dataclass ``__slots__`` need Python 3.10; we still support 3.9.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(eq=True, unsafe_hash=True, repr=False, **_SLOTS)
 class Waypoint:
     """
     A waypoint.
@@ -992,12 +1412,73 @@ class Waypoint:
     lon: Lon
     name: Optional[str] = None
     description: Optional[str] = None
-    point: LatLon = field(init=False, compare=False)
-    geocode: str = field(init=False, compare=True)
+    # Built when first used; the geocode depends only on lat and lon.
+    _point: Optional[LatLon] = field(default=None, init=False, compare=False)
+    _geocode: Optional[str] = field(default=None, init=False, compare=False)
+
+    @property
+    def point(self) -> LatLon:
+        """The :py:class:`LatLon` for this waypoint."""
+        if self._point is None:
+            self._point = LatLon(self.lat, self.lon)
+        return self._point
+
+    @property
+    def geocode(self) -> str:
+        """The OLC geocode for this waypoint."""
+        if self._geocode is None:
+            self._geocode = olc.geocode(degrees(self.lat), degrees(self.lon))
+        return self._geocode
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(lat={self.lat!r}, lon={self.lon!r}, "
+            f"name={self.name!r}, description={self.description!r}, "
+            f"point={self.point!r}, geocode={self.geocode!r})"
+        )
+
+
+@dataclass(eq=False)
+class WaypointArray(LatLonArray):
+    """
+    A route as a :py:class:`LatLonArray`, with the waypoint names and descriptions
+    in parallel lists.
+
+    :ivar names: the :py:attr:`Waypoint.name` of each point.
+    :ivar descriptions: the :py:attr:`Waypoint.description` of each point.
+
+    >>> route = WaypointArray.from_waypoints(
+    ...     [
+    ...         Waypoint(Lat.fromdegrees(37.549033), Lon.fromdegrees(-76.328957), "start"),
+    ...         Waypoint(Lat.fromdegrees(37.2678), Lon.fromdegrees(-76.0178), "end"),
+    ...     ]
+    ... )
+    >>> route.names
+    ['start', 'end']
+    >>> np.round(route.cumulative_range(), 3)
+    array([22.48])
+    """
+
+    names: list[Optional[str]]
+    descriptions: list[Optional[str]]
 
-    def __post_init__(self) -> None:
-        self.point = LatLon(self.lat, self.lon)
-        self.geocode = olc.OLC().encode(degrees(self.lat), degrees(self.lon))
+    @classmethod
+    def from_waypoints(cls, waypoints: Iterable[Waypoint]) -> "WaypointArray":
+        """
+        Packs :py:class:`Waypoint` objects into arrays and lists.
+
+        :param waypoints: iterable of :py:class:`Waypoint` objects.
+        :returns: :py:class:`WaypointArray`
+        """
+        route = list(waypoints)
+        coordinates = [(float(w.lat), float(w.lon)) for w in route]
+        packed = np.array(coordinates, dtype=np.float64).reshape(-1, 2)
+        return cls(
+            packed[:, 0].copy(),
+            packed[:, 1].copy(),
+            [w.name for w in route],
+            [w.description for w in route],
+        )
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -36,7 +36,9 @@ that involve careful rounding that are implemented incorrectly.
 
 """
 
-from typing import Iterable, Iterator
+import functools
+import math
+from typing import Iterator
 
 
 class Geocode:  # pragma: no cover
@@ -49,6 +51,10 @@ class Geocode:  # pragma: no cover
 
 class OLC(Geocode):
     code = "23456789CFGHJMPQRVWX"
+    # Reverse lookup of a digit's value from its character; replaces ``code.index(c)``.
+    value = {c: i for i, c in enumerate(code)}
+    # A short code may be padded with "0", which decodes like "2".
+    padded_value = {**value, "0": 0}
 
     def encode(self, lat: float, lon: float, size: int = 11) -> str:
         """
@@ -75,23 +81,27 @@ class OLC(Geocode):
                 adj = 20 ** -3 / 5 ** (size - 10)
             lat -= adj
         # Normalize longitude to -180 to +180 (excluding +180)
-        while lon >= 180:
-            lon -= 360
-        while lon < -180:
-            lon += 360
+        # fmod() is exact, so this is the value repeated +/-360 steps would reach.
+        if not -180 <= lon < 180:
+            lon = math.fmod(lon, 360)
+            if lon >= 180:
+                lon -= 360
+            elif lon < -180:
+                lon += 360
         # Convert to N latitude and E longitude via offsets to remove signs.
         nlat = lat + 90
         elon = lon + 180
         # Create the sequences of digits
-        lat_digits = list(base20(nlat, lsb=5))
-        lon_digits = list(base20(elon, lsb=4))
+        lat_digits = base20(nlat, lsb=5)
+        lon_digits = base20(elon, lsb=4)
+        code = self.code
         # Interleave 5 pairs of digits from latitude and longitude for the most significant portion
         msb = "".join(
-            f"{self.code[lat_digits[i]]}{self.code[lon_digits[i]]}" for i in range(5)
+            [code[lat] + code[lon] for lat, lon in zip(lat_digits[:5], lon_digits[:5])]
         )
         # Append five of the LSB characters from pairs of digits.
         lsb = "".join(
-            self.code[lat_digits[p] * 4 + lon_digits[p]] for p in range(5, 10)
+            [code[lat * 4 + lon] for lat, lon in zip(lat_digits[5:], lon_digits[5:])]
         )
         # Handle the size parameter with truncation and/or zero-padding.
         olc = (msb + lsb)[:size]
@@ -128,24 +138,21 @@ class OLC(Geocode):
         """
         # Expand to a single, uniform string (without punctuation or special cases.)
         # 10 MSB positions of 2-digit, 5 LSB positions of 1-digit.
-        olc_clean = "".join(olc.split("+"))
-        if len(olc_clean) <= 15:
-            olc_15 = olc_clean.replace("0", "2") + "2" * (15 - len(olc_clean))
-        else:
-            olc_15 = olc_clean
-        # Each of the LSB Characters needs to be expanded into base 5/base 4 lat-lon pair
-        msb = olc_15[:10]
-        lsb = olc_15[10:15]
-        pairs = (divmod(self.code.index(c), 5) for c in lsb)
-        lsb_expanded = "".join(
-            f"{self.code[lat]}{self.code[lon]}" for lat, lon in pairs
-        )
-        lsb_expanded += "2" * (10 - len(lsb_expanded))
-        full = msb + lsb_expanded
+        # One pass maps the characters to digits; zero padding and any missing
+        # positions become the "2" digit, 0.
+        olc_clean = olc.replace("+", "")
+        value = self.padded_value if len(olc_clean) <= 15 else self.value
+        try:
+            digits = [value[c] for c in olc_clean[:15]]
+        except KeyError as ex:
+            raise ValueError(f"Cannot decode {olc!r}") from ex
+        digits += [0] * (15 - len(digits))
+        # Each of the LSB digits needs to be expanded into base 5/base 4 lat-lon pair
+        lsb = digits[10:]
         # Convert from base-20 to float.
         # TODO: Honor the size parameter by chopping the values.
-        nlat = from20(list(self.code.index(c) for c in full[0::2]), lsb=5)
-        elon = from20(list(self.code.index(c) for c in full[1::2]), lsb=4)
+        nlat = from20(digits[0:10:2] + [d // 5 for d in lsb], lsb=5)
+        elon = from20(digits[1:10:2] + [d % 5 for d in lsb], lsb=4)
         # TODO: Tweak a tiny bit with the level of precision given by the size.
         nlat += 0.5 / 20 ** 3 / 5 ** 5
         elon += 0.5 / 20 ** 3 / 4 ** 5
@@ -153,7 +160,27 @@ class OLC(Geocode):
         return round(nlat - 90, 8), round(elon - 180, 8)
 
 
-def base20(x: float, msb: int = 20, lsb: int = 5) -> Iterable[int]:
+# One shared, stateless encoder for :py:func:`geocode`.
+_OLC = OLC()
+
+
+@functools.lru_cache(maxsize=4096)
+def geocode(lat: float, lon: float) -> str:
+    """
+    The default-size OLC geocode for a lat, lon pair, in degrees.
+    Routes and logs revisit the same positions, so the results are cached.
+
+    >>> geocode(1.286785, 103.854503)
+    '6PH57VP3+PR6'
+
+    :param lat: latitude in degrees
+    :param lon: longitude in degrees
+    :returns: the OLC string
+    """
+    return _OLC.encode(lat, lon)
+
+
+def base20(x: float, msb: int = 20, lsb: int = 5) -> list[int]:
     """
     Decompose a positive Lat or Lon value to a sequence of 5 base-20 values
     followed by 5 base-4 or base-5 values.
@@ -180,33 +207,23 @@ def base20(x: float, msb: int = 20, lsb: int = 5) -> Iterable[int]:
     [9, 2, 15, 12, 17, 3, 2, 0, 1, 3]
 
     """
-
-    def ldigits(value: int, base: int) -> Iterable[int]:
-        """
-        Generates 5 digits from an integer value for a given base.
-        This is starts with Least Significant, which requires reversal.
-        """
-        for b in range(5):
-            value, digit = divmod(value, base)
-            yield digit
-
-    def digits(value: int, base: int) -> list[int]:
-        """
-        A list of six digits from a positive integer value for a given base.
-        This starts with the Most Significant Digit.
-        """
-        return list(reversed(list(ldigits(value, base))))
-
     # Scale up the latitude or longitude float to a large integer for the 5 MSB's.
-    x_most = int(round(x * msb ** 3, 6))
-    # Create the sequence of digits in the MSB base (20, usually)
-    msb_digits = digits(int(x_most), msb)
+    x_msb = x * msb ** 3
+    x_most = int(round(x_msb, 6))
     # Scale up the latitude or longitude float to a larger integer for the 5 LSB's.
-    x_least = int(round(x * msb ** 3 * lsb ** 5, 5))
-    # Create a sequence of digits in the LSB base (4 or 5, depending.)
-    lsb_digits = digits(int(x_least), lsb)
-    # Emit the sequence of digits
-    return msb_digits + lsb_digits
+    x_least = int(round(x_msb * lsb ** 5, 5))
+    # Peel off the digits, least significant first, in the MSB base (20, usually)
+    # and the LSB base (4 or 5, depending.) Only the low five digits of each are kept.
+    x_most, m4 = divmod(x_most, msb)
+    x_most, m3 = divmod(x_most, msb)
+    x_most, m2 = divmod(x_most, msb)
+    x_most, m1 = divmod(x_most, msb)
+    x_least, l4 = divmod(x_least, lsb)
+    x_least, l3 = divmod(x_least, lsb)
+    x_least, l2 = divmod(x_least, lsb)
+    x_least, l1 = divmod(x_least, lsb)
+    # Emit the sequence of digits, most significant first.
+    return [x_most % msb, m1, m2, m3, m4, x_least % lsb, l1, l2, l3, l4]
 
 
 def from20(digits: list[int], msb: int = 20, lsb: int = 5) -> float:
@@ -224,12 +241,10 @@ def from20(digits: list[int], msb: int = 20, lsb: int = 5) -> float:
     True
 
     """
-    m = digits[0]
-    for d in digits[1:5]:
-        m = m * msb + d
-    l = digits[5]
-    for d in digits[6:10]:
-        l = l * lsb + d
+    m0, m1, m2, m3, m4, l0, l1, l2, l3, l4 = digits[:10]
+    # Horner's rule, unrolled for the five digits of each base.
+    m = (((m0 * msb + m1) * msb + m2) * msb + m3) * msb + m4
+    l = (((l0 * lsb + l1) * lsb + l2) * lsb + l3) * lsb + l4
     # print(f"{digits=} {m=} {msb ** 3=} {m / msb ** 3=} {l=} {l / lsb**5=}")
     return (m + l / lsb ** 5) / msb ** 3
 
@@ -72,10 +72,10 @@ import sys
 from typing import Iterable, Callable, Any, Optional, ClassVar, TextIO, Union, cast
 from navtools import navigation
 from navtools import analysis
-from navtools.navigation import Waypoint
+from navtools.navigation import Waypoint, _SLOTS
 
 
-@dataclass(eq=True)
+@dataclass(eq=True, **_SLOTS)
 class Leg:
     """
     Map attribute values between OpenCPN CSV, something Pythonic,
@@ -116,6 +116,37 @@ class Leg:
         ("Description", lambda l: f"{l.waypoint.description}"),
         ("Course", lambda l: f"{l.course}"),
     )
+    headers: ClassVar[tuple[str, ...]] = tuple(k for k, _ in attr_names)
+
+    # Patterns for the OpenCPN text fields, compiled once for all legs.
+    eta_pat: ClassVar[re.Pattern[str]] = re.compile(r"(?:Start: )?(.{16})\s\((\w+)\)")
+    distance_pat: ClassVar[re.Pattern[str]] = re.compile(r"\s*(\d+\.?\d*)\s\w+")
+    bearing_pat: ClassVar[re.Pattern[str]] = re.compile(r"\s*(\d+)\s.\w+")
+    eta_time_pat: ClassVar[re.Pattern[str]] = re.compile(
+        r"(\d\d)/(\d\d)/(\d\d\d\d) (\d\d):(\d\d)"
+    )
+
+    @classmethod
+    def parse_eta(cls, text: str) -> datetime.datetime:
+        """
+        Parses an ETA timestamp.
+
+        OpenCPN writes these as :samp:`{mm}/{dd}/{yyyy} {HH}:{MM}`, which is decoded directly.
+        Anything else is left to :py:func:`analysis.parse_date`,
+        which tries each of its formats with :py:meth:`datetime.datetime.strptime`.
+
+        >>> Leg.parse_eta("05/25/2021 08:43")
+        datetime.datetime(2021, 5, 25, 8, 43)
+        """
+        if (m := cls.eta_time_pat.fullmatch(text)) is not None:
+            month, day, year, hour, minute = m.groups()
+            try:
+                return datetime.datetime(
+                    int(year), int(month), int(day), int(hour), int(minute)
+                )
+            except ValueError:
+                pass
+        return analysis.parse_date(text)
 
     @classmethod
     def fromdict(cls, details: dict[str, str]) -> "Leg":
@@ -123,8 +154,7 @@ class Leg:
         try:
             eta_time, eta_summary = (
                 m.groups()
-                if (m := re.match(r"(?:Start: )?(.{16})\s\((\w+)\)", details["ETA"]))
-                is not None
+                if (m := cls.eta_pat.match(details["ETA"])) is not None
                 else ("", "")
             )
             wpt = Waypoint(
@@ -139,20 +169,18 @@ class Leg:
                 # name=details["To waypoint"],
                 distance=(
                     float(m.group(1))
-                    if (m := re.match(r"\s*(\d+\.?\d*)\s\w+", details["Distance"]))
-                    is not None
+                    if (m := cls.distance_pat.match(details["Distance"])) is not None
                     else None
                 ),
                 bearing=(
                     float(m.group(1))
-                    if (m := re.match(r"\s*(\d+)\s.\w+", details["Bearing"]))
-                    is not None
+                    if (m := cls.bearing_pat.match(details["Bearing"])) is not None
                     else None
                 ),
                 # lat=navigation.Lat.fromstring(details["Latitude"]),
                 # lon=navigation.Lon.fromstring(details["Longitude"]),
                 ETE=Duration.parse(details["ETE"]),
-                ETA=(analysis.parse_date(eta_time) if eta_time else None),
+                ETA=(cls.parse_eta(eta_time) if eta_time else None),
                 ETA_summary=eta_summary,
                 speed=float(details["Speed"]),
                 tide=details["Next tide event"],
@@ -160,8 +188,7 @@ class Leg:
                 course=(
                     (
                         float(m.group(1))
-                        if (m := re.match(r"\s*(\d+)\s.\w+", details["Course"]))
-                        is not None
+                        if (m := cls.bearing_pat.match(details["Course"])) is not None
                         else None
                     )
                     if details["Course"] != "Arrived"
@@ -172,13 +199,18 @@ class Leg:
             print(f"Invalid {details} {ex!r}")
             raise
 
+    def as_row(self) -> tuple[str, ...]:
+        """
+        Emits a Leg as a tuple of formatted values, in the order of the :py:attr:`headers`.
+        """
+        return tuple([attr_func(self) for _, attr_func in self.attr_names])
+
     def asdict(self) -> dict[str, str]:
         """
         Emits a Leg as a dictionary.
         Uses the attr_names mapping to original CSV attribute names.
         """
-        r = {k: str(attr_func(self)) for k, attr_func in self.attr_names}
-        return r
+        return dict(zip(self.headers, self.as_row()))
 
 
 class Route:
@@ -241,7 +273,7 @@ class Route:
         return Route(title, summary, legs)
 
 
-@dataclass(eq=True, order=True, frozen=True)
+@dataclass(eq=True, order=True, frozen=True, **_SLOTS)
 class Duration:
     """
     A duration in days, hours, minutes, and seconds.
@@ -274,6 +306,9 @@ class Duration:
     m: int = 0
     s: int = 0
 
+    # Digits and a unit label, compiled once for all durations.
+    parse_pat: ClassVar[re.Pattern[str]] = re.compile(r"(\d+)([dHMS])")
+
     @classmethod
     def parse(cls, text: str) -> "Duration":
         """
@@ -284,7 +319,7 @@ class Duration:
         """
         raw = {
             match.group(2).lower(): int(match.group(1))
-            for match in re.finditer("(\d+)([dHMS])", text)
+            for match in cls.parse_pat.finditer(text)
         }
         return cls(**raw)
 
@@ -359,22 +394,17 @@ def to_html(route: Route) -> None:
 
     :param route: a Route object.
     """
-    print(f"<table>")
-    for k, v in route.summary.items():
-        print(f"<tr><td>{k}</td><td>{v}</td></tr>")
-    print(f"</table>")
-    print(f"<table>")
-    print(f"<tr>")
-    for k, f in Leg.attr_names:
-        print(f"<th>{k}</th>", end="")
-    print()
-    print(f"</tr>")
-    for row in route.legs:
-        data = row.asdict()
-        for k, f in Leg.attr_names:
-            print(f"<td>{data[k]}</td>", end="")
-        print()
-    print(f"</table>")
+    lines = ["<table>"]
+    lines.extend(f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in route.summary.items())
+    lines.append("</table>")
+    lines.append("<table>")
+    lines.append("<tr>")
+    lines.append("".join(f"<th>{k}</th>" for k in Leg.headers))
+    lines.append("</tr>")
+    lines.extend("".join(f"<td>{v}</td>" for v in row.as_row()) for row in route.legs)
+    lines.append("</table>")
+    # One write for the whole document, rather than one per cell.
+    print("\n".join(lines))
 
 
 def to_csv(route: Route) -> None:
@@ -384,10 +414,9 @@ def to_csv(route: Route) -> None:
 
     :param route: a Route object.
     """
-    headers = [k for k, f in Leg.attr_names]
-    writer = csv.DictWriter(sys.stdout, headers)
-    writer.writeheader()
-    writer.writerows(row.asdict() for row in route.legs)
+    writer = csv.writer(sys.stdout)
+    writer.writerow(Leg.headers)
+    writer.writerows(row.as_row() for row in route.legs)
 
 
 def main(argv: list[str]) -> None:
@@ -141,7 +141,7 @@ def gen_schedule(
     This is the forward algorithm starting from start_datetime.
 
     The algorithm peeks ahead to compute the course to the next waypoint.
-    This requires a route with two or more waypoints.
+    This requires a route with two or more waypoints; a shorter route yields nothing.
 
     It works like this:
 
@@ -161,8 +161,8 @@ def gen_schedule(
 
     -   Yield here with ETE and course from previous to here and no course.
 
-    This requires a wee bit of optimization to prevent duplicate cade.
-    We should, specifically, cache the distance and bearing to avoid recomputation.
+    The distance and bearing of all of the legs are computed once, up front,
+    with :py:meth:`navigation.WaypointArray.range_bearing`.
 
     :param waypoints:  Iterable collection of :py:class:`Waypoint` objects.
     :param variance: the magnetic variance (a/k/a declination) function;
@@ -174,9 +174,12 @@ def gen_schedule(
     """
     if start_datetime is None:
         start_datetime = datetime.datetime.now()
-    waypoints_iter = iter(waypoints)
-    previous, here = next(waypoints_iter), next(waypoints_iter)
-    _, next_course = navigation.range_bearing(previous.point, here.point)
+    route = list(waypoints)
+    if len(route) < 2:
+        return
+    # Range and bearing of every leg at once: leg i is from route[i] to route[i+1].
+    distances, bearings = navigation.WaypointArray.from_waypoints(route).range_bearing()
+    previous, here = route[0], route[1]
     yield SchedulePoint(
         waypoint=previous,
         distance=0,
@@ -185,16 +188,22 @@ def gen_schedule(
         speed=None,
         enroute_min=0,
         next_course=navigation.Angle(
-            next_course - variance(here.point, start_datetime)
+            float(bearings[0]) - variance(here.point, start_datetime)
         ),
         arrival=start_datetime,
     )
-    for end in waypoints_iter:
-        r, theta = navigation.range_bearing(previous.point, here.point)
-        magnetic = theta - variance(here.point, start_datetime)
+    for leg, here in enumerate(route[1:]):
+        r, theta = float(distances[leg]), navigation.Angle(bearings[leg])
+        magnetic = navigation.Angle(theta - variance(here.point, start_datetime))
         enroute_min = 60.0 * r / speed
         start_datetime += datetime.timedelta(seconds=enroute_min * 60)
-        _, next_true = navigation.range_bearing(here.point, end.point)
+        if leg + 1 < len(bearings):
+            end = route[leg + 2]
+            next_course: Optional[navigation.Angle] = navigation.Angle(
+                float(bearings[leg + 1]) - variance(end.point, start_datetime)
+            )
+        else:
+            next_course = None
         yield SchedulePoint(
             waypoint=here,
             distance=r,
@@ -202,28 +211,9 @@ def gen_schedule(
             magnetic=magnetic,
             speed=speed,
             enroute_min=enroute_min,
-            next_course=navigation.Angle(
-                next_true - variance(end.point, start_datetime)
-            ),
+            next_course=next_course,
             arrival=start_datetime,
         )
-        previous, here = here, end
-    r, theta = navigation.range_bearing(previous.point, here.point)
-    magnetic = theta - variance(here.point, start_datetime)
-    enroute_min = 60.0 * r / speed
-    # print(f"{start_datetime} {enroute_min}")
-    start_datetime += datetime.timedelta(seconds=enroute_min * 60)
-    # print(f"{start_datetime}")
-    yield SchedulePoint(
-        waypoint=here,
-        distance=r,
-        true_bearing=theta,
-        magnetic=magnetic,
-        speed=speed,
-        enroute_min=enroute_min,
-        next_course=None,
-        arrival=start_datetime,
-    )
 
 
 def nround(value: Optional[float], digits: int) -> Optional[float]:
@@ -20,6 +20,7 @@ setup(
         'navtools',
     ],
     package_data={'navtools': ["igrf11coeffs.txt", "igrf13coeffs.txt"]},
+    install_requires=['numpy'],
     classifiers=[
         "Development Status :: 6 - Mature",
         "Environment :: Console",
@@ -393,6 +393,17 @@ def test_gen_rhumb(gen_rhumb_1):
     assert points[1].delta_time is None
 
 
+def test_gen_rhumb_short():
+    entry = LogEntry(
+        time=datetime.datetime(2012, 4, 17, 9, 21),
+        lat=navigation.Lat.fromstring("37.533195"),
+        lon=navigation.Lon.fromstring("-76.316963"),
+    )
+    assert list(gen_rhumb(iter([]))) == []
+    (only,) = list(gen_rhumb(iter([entry])))
+    assert only.point is entry and only.distance is None
+
+
 
 @fixture
 def sample_track_1():
@@ -230,3 +230,11 @@ def test_early_dates():
     assert d_2009 == approx(-6.2256, rel=1e-4)
     d_1994 = declination(date=datetime.date(1994, 1, 1), nlat=0.0, elong=0.0)
     assert d_1994 == approx(-8.0643, rel=1e-4)
+
+
+def test_dense(igrfsyn13):
+    igrfsyn13.prepare()
+    g_2020, h_2020 = igrfsyn13.gh[2020]
+    assert g_2020[1][0] == igrfsyn13.g[2020][1, 0]
+    assert h_2020[13][13] == igrfsyn13.h[2020][13, 13]
+    assert h_2020[1][0] == 0.0
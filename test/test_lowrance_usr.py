@@ -65,13 +65,17 @@ def test_unpack_context_eof():
     uc = lowrance_usr.UnpackContext(BytesIO(b''))
     assert uc.eof()
 
+def test_unpack_context_read():
+    uc = lowrance_usr.UnpackContext(b'\x05\x00\x00\x00')
+    assert bytes(uc.read(2)) == b'\x05\x00'
+    assert not uc.eof()
+    assert bytes(uc.read(2)) == b'\x00\x00'
+    assert uc.eof()
+
 
 @fixture
 def mock_unpack_context_int():
-    unpack_context = Mock(
-        source = BytesIO(b'\x05\x00\x00\x00'),
-        fields = {}
-    )
+    unpack_context = lowrance_usr.UnpackContext(BytesIO(b'\x05\x00\x00\x00'))
     return unpack_context
 
 def test_field(mock_unpack_context_int):
@@ -85,10 +89,7 @@ def test_field(mock_unpack_context_int):
 
 @fixture
 def mock_unpack_context_ascii():
-    unpack_context = Mock(
-        source = BytesIO(b'\x05\x00\x00\x00xyzzy'),
-        fields = {}
-    )
+    unpack_context = lowrance_usr.UnpackContext(BytesIO(b'\x05\x00\x00\x00xyzzy'))
     return unpack_context
 
 def test_field_dependency(mock_unpack_context_ascii):
@@ -136,10 +137,7 @@ def test_field_list(mock_unpack_context_ascii):
 
 @fixture
 def mock_unpack_context_array():
-    unpack_context = Mock(
-        source = BytesIO(b'\x03\x00\xda\x0fI@T\xf8-@\x00\x00(B'),
-        fields = {}
-    )
+    unpack_context = lowrance_usr.UnpackContext(BytesIO(b'\x03\x00\xda\x0fI@T\xf8-@\x00\x00(B'))
     return unpack_context
 
 def test_field_repeat(mock_unpack_context_array):
@@ -158,6 +156,25 @@ def test_field_repeat(mock_unpack_context_array):
         {'format': '<f', 'name': 'count_and_values - values - v', 'size': '4'},
     ]
 
+def test_parser(mock_unpack_context_array):
+    f1 = lowrance_usr.AtomicField("count", "<h")
+    f2 = lowrance_usr.FieldRepeat("values", lowrance_usr.AtomicField("v", "<f"), "count")
+    f3 = lowrance_usr.FieldList(
+        "count_and_values",
+        [f1, f2]
+    )
+    parser = lowrance_usr.Parser(f3)
+    r3 = parser.parse(mock_unpack_context_array)
+    assert r3 ==  {'count': 3, 'values': approx([3.1415926, 2.718281828, 42.0])}
+    assert mock_unpack_context_array.fields["count_and_values"] == r3
+    assert parser.schema is f3
+
+def test_parser_dependency(mock_unpack_context_ascii):
+    f1 = lowrance_usr.AtomicField("name_len", "<i")
+    f2 = lowrance_usr.AtomicField("name", "<{name_len}s", lambda x: x[0].decode("ascii"))
+    parser = lowrance_usr.Parser(lowrance_usr.FieldList("name_and_len", [f1, f2]))
+    assert parser.parse(mock_unpack_context_ascii) == {"name_len": 5, "name": "xyzzy"}
+
 def test_lon_degree():
     """
     <wpt lon="-76.66669595" lat="24.36669586" >
@@ -223,6 +240,16 @@ def test_lowrance_usr(format_6):
     assert usr["routes"][0]["route_name"] == "WRDRK BLKP"
     assert usr["routes"][0]["leg_uuids"][0] == usr["waypoints"][0]["uuid"]
 
+def test_lowrance_usr_load_many(format_6, format_6_empty, tmp_path):
+    path_1 = tmp_path / "format_6.usr"
+    path_1.write_bytes(format_6.getvalue())
+    path_2 = tmp_path / "format_6_empty.usr"
+    path_2.write_bytes(format_6_empty.getvalue())
+    results = list(lowrance_usr.Lowrance_USR.load_many([path_1, path_2], max_workers=2))
+    assert [path for path, usr in results] == [path_1, path_2]
+    assert results[0][1]["waypoints"][0]["waypt_name"] == "WARDRCK BR"
+    assert results[1][1]["file_description"] == "Waypoints, routes, and trails"
+
 def test_layout(capsys):
     f = lowrance_usr.AtomicField("name", "<I", lambda x: 2 ** x[0])
     lowrance_usr.layout(f)
@@ -20,33 +20,63 @@ import datetime
 import math
 import doctest
 import navtools.navigation
+import navtools.olc
 from navtools.navigation import (
     Angle,
     AngleParser,
     Lat,
     Lon,
     LatLon,
+    LatLonArray,
+    WaypointArray,
     KM,
     NM,
     declination,
+    declination_array,
     destination,
+    destination_array,
     range_bearing,
+    range_bearing_raw,
+    range_bearing_array,
     Waypoint
 )
+import numpy as np
 
 
 def test_angle_parser():
     """
-    dms_pat = re.compile( r"(\d+)\D+(\d+)\D+(\d+)[^NEWSnews]*([NEWSnews]?)" )
-    dm_pat = re.compile( r"(\d+)\D+(\d+\.\d+)[^NEWSnews]*([NEWSnews]?)" )
-    d_pat = re.compile( r"(\d+\.\d+)[^NEWSnews]*([NEWSnews]?)" )
-    navx_dmh_pat = re.compile( r"(\d+)\D+(\d+\.\d+)[^NEWSnews]*([NEWSnews]?)" )
+    The parse_pat has three alternatives, tried in order:
+
+    - d: ``(\d+\.\d+)``
+    - dm: ``(\d+)\D+(\d+\.\d+)``
+    - dms: ``(\d+)\D+(\d+)\D+(\d+)``
+
+    Each followed by ``[^NEWSnews]*([NEWSnews]?)``
+
+    A :samp:`{d.ddd}{h}` value is handled without the pattern.
     """
     assert AngleParser.parse("10 20 30N") == approx(10.341666)
     assert AngleParser.parse("10 20.5N") == approx(10.341666)
     assert AngleParser.parse("10.341666N") == approx(10.341666)
+    assert AngleParser.parse("37°28'8\"S") == approx(-37.468888)
+    assert AngleParser.parse("10.341666w") == approx(-10.341666)
     with raises(ValueError):
         AngleParser.parse("Big Nope")
+    with raises(ValueError):
+        AngleParser.parse("10.N")
+
+
+def test_angle_fromstrings():
+    radians = Angle.fromstrings(["10.341666", "-10.341666"])
+    assert radians.dtype == np.float64
+    assert list(radians) == approx([math.radians(10.341666), math.radians(-10.341666)])
+    mixed = Lat.fromstrings(["10 20 30N", "10 20.5S", "10.341666"])
+    assert list(mixed) == approx(
+        [math.radians(10.341666), math.radians(-10.341666), math.radians(10.341666)]
+    )
+    assert Angle.fromstrings([]).shape == (0,)
+    with raises(ValueError):
+        Angle.fromstrings(["10.341666", "Big Nope"])
 
 
 def test_angle():
@@ -60,6 +90,8 @@ def test_angle():
         Angle.fromstring("True North")
     assert Angle.parse("10.341666") == approx(math.radians(10.341666))
     a = Angle.fromdegrees(10.341666)
+    assert not hasattr(a, "__dict__")
+    assert not hasattr(Lat(a), "__dict__") and not hasattr(Lon(a), "__dict__")
     assert a.radians == approx(math.radians(10.341666))
     assert a.r == approx(math.radians(10.341666))
     assert a.degrees == approx(10.341666)
@@ -72,10 +104,15 @@ def test_angle():
     assert f"{a:%d %h}" == "10.341666 +"
     assert f"{a:%03.0d %02m}" == "010 20.499960"
     assert f"{a:%03.0d %02.0m %02.0s}" == "010 20 30"
+    assert Angle._rewrite("%03.0d %02m") == ("{d:03.0f} {m:02f}", frozenset({"d", "m"}))
+    assert Angle._rewrite("%03.0d %02m") is Angle._rewrite("%03.0d %02m")
 
     edge = Angle(math.radians(9.999999999))
     assert edge.dm == approx((10, 0))
     assert edge.dms == approx((10, 0, 0))
+    carry = Angle.fromdegrees(5.55)
+    assert carry.dms == (5, 33, 0.0)
+    assert f"{carry:%02.0d %02.0m %04.1s}" == "05 33 00.0"
 
     assert (a + math.radians(10)).deg == approx(20.341666)
     assert (a - math.radians(10)).deg == approx(0.341666)
@@ -95,6 +132,7 @@ def test_angle():
 
     assert (-a).deg == approx(-10.341666)
     assert (+a).deg == approx(10.341666)
+    assert type(float(a)) is float
     assert abs(a) == a  # True because a is positive!
 
     assert round(a) == int(math.radians(10.341666))
@@ -128,6 +166,9 @@ def test_lon():
     assert a.h == "E"
     assert repr(a) == "010°20.500′E"
     assert math.degrees(a.east) == approx(10.341666)
+    w = Lon.fromstring("10 20 30W")
+    assert math.degrees(w.east) == approx(360 - 10.341666)
+    assert type(w.east) is float
 
 
 def test_LatLon():
@@ -144,11 +185,38 @@ def test_LatLon():
     assert ll_3.lat == latlon_1.lat and ll_3.lon == latlon_1.lon
     ll_4 = LatLon(50 + 21 / 60 + 50 / 3600, -(4 + 9 / 60 + 25 / 3600))
     assert ll_4.lat == latlon_1.lat and ll_4.lon == latlon_1.lon
+    ll_5 = LatLon(np.float64(50 + 21 / 60 + 50 / 3600), np.float64(-(4 + 9 / 60 + 25 / 3600)))
+    assert ll_5.lat == latlon_1.lat and ll_5.lon == latlon_1.lon
+    assert type(ll_5.lat) is Lat and type(ll_5.lon) is Lon
+    ll_6 = LatLon(latlon_1.lon, latlon_1.lat)
+    assert type(ll_6.lat) is Lat and type(ll_6.lon) is Lon
+    ll_7 = LatLon(50, -4)
+    assert ll_7.d == ("50.000N", "004.000W")
+    ll_8 = LatLon.from_degrees(50 + 21 / 60 + 50 / 3600, -(4 + 9 / 60 + 25 / 3600))
+    assert ll_8.lat == latlon_1.lat and ll_8.lon == latlon_1.lon
+    assert type(ll_8.lat) is Lat and type(ll_8.lon) is Lon
+    ll_9 = LatLon.from_radians(latlon_1._lat_r, latlon_1._lon_r)
+    assert ll_9.dms == latlon_1.dms
+    assert ll_9._lat_r == latlon_1._lat_r and ll_9._lon_r == latlon_1._lon_r
     with raises(ValueError):
         LatLon(("Can't", "Work",), 0.0)
     with raises(ValueError):
         LatLon(0.0, ["Won't Work", "Either"])
 
+    assert type(latlon_1._lat_r) is float and type(latlon_1._lon_r) is float
+    assert latlon_1._lat_r == approx(latlon_1.lat.radians)
+    assert latlon_1._lon_r == approx(latlon_1.lon.radians)
+    assert not hasattr(latlon_1, "__dict__")
+
+    # Assigning lat or lon refreshes the cached radians.
+    moved = LatLon(50, -4)
+    moved.lat = Lat.fromdegrees(51)
+    moved.lon = Lon.fromdegrees(-5)
+    assert moved._lat_r == approx(math.radians(51))
+    assert moved._lon_r == approx(math.radians(-5))
+    assert moved.near(LatLon(51, -5)) == approx(0)
+    assert range_bearing(moved, LatLon(51, -5))[0] == approx(0)
+
 
 @fixture
 def case_1():
@@ -167,6 +235,71 @@ def test_range_bearing_1(case_1):
     assert math.degrees(brg) == approx(bearing, rel=0.01)
 
 
+def test_near(case_1, case_3):
+    p1, p2, distance, bearing = case_1
+    d_nm, _ = range_bearing(p1, p2, R=NM)
+    assert p1.near(p2) == approx(d_nm)
+    assert p1.near(p2, R=KM) == approx(d_nm / NM * KM)
+    distance_from_p1 = p1.prepare_near(R=NM)
+    assert distance_from_p1(p2) == approx(d_nm)
+    assert distance_from_p1(case_3[1]) == approx(p1.near(case_3[1]))
+    assert distance_from_p1(p1) == 0.0
+
+
+def test_range_bearing_array(have_numba, case_1, case_3):
+    points = [case_1[0], case_1[1], case_3[0], case_3[1]]
+    lat = np.array([p.lat.radians for p in points])
+    lon = np.array([p.lon.radians for p in points])
+    d, tc = range_bearing_array(lat[:-1], lon[:-1], lat[1:], lon[1:], R=NM)
+    expected = [range_bearing(p1, p2, R=NM) for p1, p2 in zip(points[:-1], points[1:])]
+    assert d == approx([e_d for e_d, e_tc in expected])
+    assert tc == approx([e_tc for e_d, e_tc in expected])
+
+    # Lists work the same as arrays, with or without the kernel.
+    d_l, tc_l = range_bearing_array(
+        list(lat[:-1]), list(lon[:-1]), list(lat[1:]), list(lon[1:]), R=NM
+    )
+    assert d_l == approx(d)
+    assert tc_l == approx(tc)
+
+
+def test_range_bearing_antimeridian(have_numba):
+    west, east = LatLon(10.0, 179.5), LatLon(10.0, -179.5)
+    d, tc = range_bearing(west, east)
+    assert d == approx(60 * math.cos(math.radians(10.0)), rel=1e-3)
+    assert range_bearing_raw(west, east) == approx((d, tc.radians))
+    assert type(range_bearing_raw(west, east)[1]) is float
+    assert tc.degrees == approx(90.0)
+    d, tc = range_bearing(east, west)
+    assert tc.degrees == approx(270.0)
+    assert west.near(east) == approx(d)
+    assert west.prepare_near()(east) == approx(d)
+    d_a, tc_a = range_bearing_array(
+        np.array([west._lat_r, east._lat_r]),
+        np.array([west._lon_r, east._lon_r]),
+        np.array([east._lat_r, west._lat_r]),
+        np.array([east._lon_r, west._lon_r]),
+    )
+    assert d_a == approx([d, d])
+    assert np.degrees(tc_a) == approx([90.0, 270.0])
+
+
+def test_latlon_array(case_1, case_3):
+    points = [case_1[0], case_1[1], case_3[0], case_3[1]]
+    route = LatLonArray.from_latlons(points)
+    assert len(route) == 4
+    assert route.lat == approx([p.lat.radians for p in points])
+    assert route.lon == approx([p.lon.radians for p in points])
+    expected = [range_bearing(p1, p2, R=NM) for p1, p2 in zip(points[:-1], points[1:])]
+    d, tc = route.range_bearing(R=NM)
+    assert d == approx([e_d for e_d, e_tc in expected])
+    assert tc == approx([e_tc for e_d, e_tc in expected])
+    assert route.cumulative_range(R=NM) == approx(
+        [sum(e_d for e_d, e_tc in expected[: i + 1]) for i in range(3)]
+    )
+    assert len(LatLonArray.from_latlons([]).cumulative_range()) == 0
+
+
 @fixture
 def case_2():
     """
@@ -195,6 +328,30 @@ def test_destination_2(case_2):
     )
 
 
+@fixture(params=[True, False], ids=["kernel", "numpy"])
+def have_numba(request, monkeypatch):
+    """Runs a test with the compiled kernel and with the NumPy fallback."""
+    monkeypatch.setattr(navtools.navigation, "HAVE_NUMBA", request.param)
+    return request.param
+
+
+def test_destination_array(have_numba, case_2, pt_range_bearing_4):
+    p1, _, distance, bearing = pt_range_bearing_4
+    # Along-track, due east, and across the north pole.
+    ranges = np.array([distance, distance, 12000.0])
+    bearings = np.array([bearing, 90.0, 0.0])
+    lat2, lon2 = destination_array(p1.lat.radians, p1.lon.radians, ranges, bearings, R=KM)
+    for r, b, lat, lon in zip(ranges, bearings, lat2, lon2):
+        expected = destination(p1, r, b, R=KM)
+        assert lat == approx(expected.lat.radians)
+        assert lon == approx(expected.lon.radians)
+    assert lat2.shape == (3,) and lon2.shape == (3,)
+    track = LatLonArray.from_latlons([p1, p1]).destination(ranges[:2], bearings[:2], R=KM)
+    assert type(track) is LatLonArray and len(track) == 2
+    assert track.lat == approx(lat2[:2])
+    assert track.lon == approx(lon2[:2])
+
+
 @fixture
 def case_3():
     """
@@ -261,6 +418,16 @@ def test_declination_equator():
     assert math.degrees(d) == approx(-5.801, rel=1E-3)
 
 
+def test_declination_datetime():
+    """A datetime gives the same declination as its date, from the same cached year."""
+    p1 = LatLon(lat=Lat.fromdegrees(37.8311, "N"), lon=Lon.fromdegrees(76.2819, "W"))
+    d = declination(p1, date=datetime.date(2012, 4, 18))
+    hits = navtools.navigation._astro_dt_tm.cache_info().hits
+    assert declination(p1, date=datetime.datetime(2012, 4, 18, 9, 30)) == d
+    assert declination(p1, date=datetime.datetime(2012, 4, 18, 17, 45)) == d
+    assert navtools.navigation._astro_dt_tm.cache_info().hits == hits + 2
+
+
 @fixture
 def mock_datetime(monkeypatch):
     mock_date = Mock(today=Mock(return_value=datetime.date(2015, 1, 1)))
@@ -275,10 +442,25 @@ def test_declination_2(mock_datetime):
     Geomag_Case(date=2015.0, lat=0.0, lon=0.0, alt=0.0, coord='D', D_deg='-5d', D_min='26m')
     """
     d = declination(LatLon(lat=0.0, lon=0.0))
-    assert mock_datetime.mock_calls == [call.datetime.today()]
+    assert mock_datetime.mock_calls == [call.date.today()]
     assert d == approx(math.radians(-(5 + 26 / 60)), rel=0.1 / 60)
 
 
+def test_declination_array():
+    points = [
+        LatLon(lat=Lat.fromdegrees(37.8311, "N"), lon=Lon.fromdegrees(76.2819, "W")),
+        LatLon(lat=Lat.fromstring("0.0N"), lon=Lon.fromstring("0.0E")),
+    ]
+    date = datetime.date(2012, 4, 18)
+    lat = np.array([p._lat_r for p in points])
+    lon = np.array([p._lon_r for p in points])
+    decl = declination_array(lat, lon, date=date)
+    assert decl.shape == (2,)
+    assert decl == approx([declination(p, date=date) for p in points])
+    assert declination_array(lat[0], lon[0], date=date) == approx(decl[0])
+    assert LatLonArray.from_latlons(points).declination(date) == approx(decl)
+
+
 
 def test_waypoint():
     lat = Lat(math.radians(47.0))
@@ -291,5 +473,32 @@ def test_waypoint():
         )
     assert wp.lat == lat
     assert wp.lon == lon
+    assert wp._point is None and wp._geocode is None
     assert wp.point.near(LatLon(lat, lon)) < 1E-05
+    assert wp.point is wp.point
     assert wp.geocode == "8FVC2222+222"
+    hits = navtools.olc.geocode.cache_info().hits
+    wp_2 = Waypoint(lat=lat, lon=lon, name="again")
+    assert wp_2.geocode == wp.geocode
+    assert navtools.olc.geocode.cache_info().hits == hits + 1
+    assert wp == Waypoint(lat=lat, lon=lon, name="sample", description="test data")
+    assert hash(wp) == hash(Waypoint(lat=lat, lon=lon, name="sample", description="test data"))
+    assert wp != wp_2
+    if sys.version_info >= (3, 10):
+        assert not hasattr(wp, "__dict__")
+
+
+def test_waypoint_array(case_1):
+    route = [
+        Waypoint(case_1[0].lat, case_1[0].lon, name="one", description="first"),
+        Waypoint(case_1[1].lat, case_1[1].lon, name="two"),
+    ]
+    packed = WaypointArray.from_waypoints(route)
+    assert len(packed) == 2
+    assert packed.lat == approx([wp.lat.radians for wp in route])
+    assert packed.lon == approx([wp.lon.radians for wp in route])
+    assert packed.names == ["one", "two"]
+    assert packed.descriptions == ["first", None]
+    d, tc = packed.range_bearing(R=NM)
+    assert d == approx([range_bearing(case_1[0], case_1[1], R=NM)[0]])
+    assert len(WaypointArray.from_waypoints([])) == 0
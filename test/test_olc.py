@@ -100,3 +100,16 @@ def test_decode_2(decode_case_2):
     lat, lon = olc.OLC().decode(decode_case_2.code)
     assert decode_case_2.latLo <= lat <= decode_case_2.latHi, f"{decode_case_2}: {lat!r} not in latLo-latHi"
     assert decode_case_2.lngLo <= lon <= decode_case_2.lngHi, f"{decode_case_2}: {lon!r} not in lngLo-lngHi"
+
+def test_encode_normalize_lon():
+    code = olc.OLC().encode(47.0, 8.0)
+    assert olc.OLC().encode(47.0, 8.0 + 720) == code
+    assert olc.OLC().encode(47.0, 8.0 - 1080) == code
+    # Far out of range; repeated subtraction of 360 would never finish.
+    assert olc.OLC().encode(0.0, 1e20).startswith("6")
+
+def test_geocode():
+    assert olc.geocode(1.286785, 103.854503) == olc.OLC().encode(1.286785, 103.854503)
+    hits = olc.geocode.cache_info().hits
+    assert olc.geocode(1.286785, 103.854503) == "6PH57VP3+PR6"
+    assert olc.geocode.cache_info().hits == hits + 1
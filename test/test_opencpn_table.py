@@ -4,6 +4,7 @@ Test the :py:mod:`opencpn_table` application.
 
 from pytest import *
 import re
+import sys
 from textwrap import dedent
 from navtools.opencpn_table import *
 from navtools.navigation import Waypoint
@@ -52,6 +53,10 @@ def test_leg():
         "To waypoint": "Beafort, NC",
     }
     assert leg_0.asdict() == expected_dict
+    assert leg_0.as_row() == tuple(expected_dict[k] for k in Leg.headers)
+    if sys.version_info >= (3, 10):
+        assert not hasattr(leg_0, "__dict__")
+        assert not hasattr(leg_0.ETE, "__dict__")
 
 
 def test_leg_bad(capsys):
@@ -74,6 +79,14 @@ def test_leg_bad(capsys):
     assert out == f"Invalid {r_bad} KeyError('Distance')\n"
 
 
+def test_parse_eta():
+    assert Leg.parse_eta("05/26/2021 04:47") == datetime.datetime(2021, 5, 26, 4, 47)
+    # Other layouts fall back to the general date parser.
+    assert Leg.parse_eta("2021-05-26 04:47") == datetime.datetime(2021, 5, 26, 4, 47)
+    with raises(ValueError):
+        Leg.parse_eta("02/30/2021 04:47")
+
+
 @fixture
 def route_path(tmp_path):
     path = tmp_path / "test_1.csv"
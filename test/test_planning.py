@@ -178,6 +178,12 @@ def test_gen_schedule_1(gen_schedule_1):
     assert points[2].magnetic.deg == approx(358.9, rel=1E-3)
     assert points[2].enroute_min == approx(7.19336232)
 
+def test_gen_schedule_short_route(schedule_1):
+    one_waypoint = gen_schedule(iter(schedule_1[:1]), declination, start_datetime=datetime.date(2012, 4, 18))
+    assert list(one_waypoint) == []
+    no_waypoints = gen_schedule(iter([]), declination, start_datetime=datetime.date(2012, 4, 18))
+    assert list(no_waypoints) == []
+
 @fixture
 def mock_today(monkeypatch):
     date_class = Mock(today=Mock(return_value=datetime.date(2021, 1, 18)))